@@ -289,33 +289,54 @@ def load_whitelist(whitelist_path: str) -> set:
 		return set()
 
 
-def generate_whitelist(patterns: List[str], output_file: str, append: bool = False, dry_run: bool = False) -> None:
+def _relative_matches(patterns: List[str], root_dir: Optional[str] = None) -> List[str]:
 	"""
-	Generate whitelist file from glob patterns.
+	Glob patterns under root_dir and return the matches relative to it.
 
 	Args:
 		patterns: List of glob patterns to match files
-		output_file: Path to output whitelist file
-		append: If True, append to existing file; if False, overwrite
-		dry_run: If True, print matched files without writing
+		root_dir: Directory that patterns are matched in (defaults to the current working directory)
+
+	Returns:
+		Matched paths relative to root_dir, or as matched if they fall outside it (may contain duplicates)
 	"""
+	root = Path(root_dir) if root_dir is not None else Path.cwd()
+
 	# Collect all matching files
 	all_files = []
 	for pattern in patterns:
-		matching_files = glob.glob(pattern, recursive=True)
+		matching_files = glob.glob(pattern, root_dir=root_dir, recursive=True)
 		all_files.extend(matching_files)
 
-	# Convert to relative paths and sort
+	# Convert to relative paths
 	relative_paths = []
-	cwd = Path.cwd()
+	resolved_root = root.resolve()
 	for file_path in all_files:
 		try:
-			abs_path = Path(file_path).resolve()
-			relative_path = abs_path.relative_to(cwd)
+			abs_path = (root / file_path).resolve()
+			relative_path = abs_path.relative_to(resolved_root)
 			relative_paths.append(str(relative_path))
 		except (ValueError, OSError):
 			# If path can't be made relative, use absolute
 			relative_paths.append(file_path)
+	return relative_paths
+
+
+def generate_whitelist(
+	patterns: List[str], output_file: str, append: bool = False, dry_run: bool = False, root_dir: Optional[str] = None
+) -> None:
+	"""
+	Generate whitelist file from glob patterns.
+
+	Args:
+		patterns: List of glob patterns to match files
+		output_file: Path to output whitelist file
+		append: If True, append to existing file; if False, overwrite
+		dry_run: If True, print matched files without writing
+		root_dir: Directory that patterns are matched in and written relative to
+			(defaults to the current working directory); output_file is not affected
+	"""
+	relative_paths = _relative_matches(patterns, root_dir)
 
 	# Remove duplicates and sort
 	relative_paths = sorted(set(relative_paths))
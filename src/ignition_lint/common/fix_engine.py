@@ -44,7 +44,12 @@ class FixResult:
 
 
 class FixEngine:
-	"""Applies fix operations to JSON data via PathTranslator."""
+	"""
+	Applies fix operations to JSON data via PathTranslator.
+
+	Fixes modify the translator's json_data in place; callers that need the
+	original data afterwards must pass in a copy.
+	"""
 
 	def __init__(self, path_translator: PathTranslator):
 		self.path_translator = path_translator
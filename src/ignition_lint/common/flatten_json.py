@@ -68,6 +68,31 @@ def format_json(obj):
 	return result
 
 
+def read_json_from_stream(stream):
+	"""Parse JSON from a text stream, preserving key order.
+
+	Args:
+		stream: Readable text file-like object.
+
+	Returns:
+		OrderedDict: Parsed JSON data.
+
+	Raises:
+		json.JSONDecodeError: If the content is not valid JSON.
+	"""
+	return json.load(stream, object_pairs_hook=OrderedDict)
+
+
+def write_json_to_stream(stream, data):
+	"""Write formatted JSON to a text stream.
+
+	Args:
+		stream: Writable text file-like object.
+		data: JSON-serializable object.
+	"""
+	stream.write(format_json(data))
+
+
 def read_json_file(file_path):
 	"""Read and parse a JSON file while preserving Unicode escapes.
 
@@ -83,10 +108,7 @@ def read_json_file(file_path):
 	file_path = Path(file_path).resolve()
 	try:
 		with file_path.open("r", encoding="utf-8") as file:
-			content = file.read()
-			return json.loads(content, object_pairs_hook=OrderedDict)
-			# preserved_content = preserve_unicode_escapes(content)
-			# return json.loads(preserved_content, object_pairs_hook=OrderedDict)
+			return read_json_from_stream(file)
 	except FileNotFoundError:
 		LOGGER.error("File %s not found. Confirm the file exists and is accessible.", file_path)
 		sys.exit(1)
@@ -110,6 +132,7 @@ def write_json_file(file_path, data):
 		# Ensure the parent directory exists
 		file_path.parent.mkdir(parents=True, exist_ok=True)
 
+		# Format before opening so a serialization error never truncates the existing file
 		formatted_json = format_json(data)
 		# restored_content = restore_unicode_escapes(formatted_json)
 		with file_path.open("w", encoding="utf-8", newline="\n") as file:
@@ -247,6 +270,18 @@ def flatten_json(data, path="", results=None):
 	return results
 
 
+def flatten_dict(data):
+	"""Flatten already-parsed JSON data and return sorted results.
+
+	Args:
+		data: JSON data built from dicts, lists and scalars, as json.load would produce.
+
+	Returns:
+		OrderedDict: Sorted flattened JSON data.
+	"""
+	return OrderedDict(sorted(flatten_json(data).items()))
+
+
 def flatten_file(file_path):
 	"""Flatten a JSON file and return sorted results.
 
@@ -256,6 +291,4 @@ def flatten_file(file_path):
 	Returns:
 		OrderedDict: Sorted flattened JSON data.
 	"""
-	json_data = read_json_file(file_path)
-	flat_json = flatten_json(json_data)
-	return OrderedDict(sorted(flat_json.items()))
+	return flatten_dict(read_json_file(file_path))
@@ -33,42 +33,36 @@ class PathTranslator:
 
 	def _build_mappings(self, data, model_path: str, json_path: list):
 		"""
-		Recursively walk the JSON tree, mirroring flatten_json logic,
-		to build path mappings.
+		Walk the JSON tree, mirroring flatten_json logic, to build path mappings.
+
+		Uses an explicit stack instead of recursion so deeply nested views do not
+		grow the call stack. Children are pushed in reverse so mappings are still
+		recorded in document order.
 		"""
-		if isinstance(data, dict):
-			# Mirror _get_component_path: if dict has meta.name, include it in model path
-			component_name = data.get('meta', {}).get('name')
-			if component_name:
-				new_model_path = f"{model_path}.{component_name}" if model_path else component_name
-				# Record: this model path (with component name) maps to this json path
-				self._model_to_json[new_model_path] = list(json_path)
-				# Record where meta.name lives for this component
-				self._component_name_paths[new_model_path] = list(json_path) + ['meta', 'name']
-				model_path = new_model_path
-
-			for key, value in data.items():
-				child_model_path = f"{model_path}.{key}" if model_path else key
-				child_json_path = json_path + [key]
-				if isinstance(value, dict):
-					self._build_mappings(value, child_model_path, child_json_path)
-				elif isinstance(value, list):
-					self._build_list_mappings(value, child_model_path, child_json_path)
-				else:
-					self._model_to_json[child_model_path] = child_json_path
-
-		elif isinstance(data, list):
-			self._build_list_mappings(data, model_path, json_path)
-
-	def _build_list_mappings(self, items: list, model_path: str, json_path: list):
-		"""Build mappings for list items."""
-		for index, item in enumerate(items):
-			item_model_path = f"{model_path}[{index}]"
-			item_json_path = json_path + [index]
-			if isinstance(item, (dict, list)):
-				self._build_mappings(item, item_model_path, item_json_path)
+		stack = [(data, model_path, json_path)]
+		while stack:
+			node, node_model_path, node_json_path = stack.pop()
+			if isinstance(node, dict):
+				# Mirror _get_component_path: if dict has meta.name, include it in model path
+				component_name = node.get('meta', {}).get('name')
+				if component_name:
+					new_model_path = f"{node_model_path}.{component_name}" if node_model_path else component_name
+					# Record: this model path (with component name) maps to this json path
+					self._model_to_json[new_model_path] = list(node_json_path)
+					# Record where meta.name lives for this component
+					self._component_name_paths[new_model_path] = node_json_path + ['meta', 'name']
+					node_model_path = new_model_path
+
+				children = [(
+					value, f"{node_model_path}.{key}" if node_model_path else key, node_json_path + [key]
+				) for key, value in node.items()]
+			elif isinstance(node, list):
+				children = [(item, f"{node_model_path}[{index}]", node_json_path + [index])
+						for index, item in enumerate(node)]
 			else:
-				self._model_to_json[item_model_path] = item_json_path
+				self._model_to_json[node_model_path] = node_json_path
+				continue
+			stack.extend(reversed(children))
 
 	def model_path_to_json_path(self, model_path: str) -> Optional[list]:
 		"""
@@ -137,10 +131,8 @@ class PathTranslator:
 		Returns True if replacement was made, False otherwise.
 		"""
 		value = self.get_value(json_path)
-		if not isinstance(value, str):
-			return False
-		if old_substring not in value:
+		# Reject before str.replace so non-matching values never allocate a copy
+		if not isinstance(value, str) or old_substring not in value:
 			return False
-		new_value = value.replace(old_substring, new_substring)
-		self.set_value(json_path, new_value)
+		self.set_value(json_path, value.replace(old_substring, new_substring))
 		return True
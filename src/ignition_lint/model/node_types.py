@@ -4,6 +4,7 @@ It includes base classes for nodes, specific node types, and an enum for node ty
 It also provides visitor support for processing nodes in a structured way.
 """
 
+import functools
 import re
 from enum import Enum
 from abc import ABC
@@ -25,12 +26,13 @@ class NodeType(Enum):
 	PROPERTY = "property"
 
 
-# Grouped node types - defined outside the enum to avoid enum member confusion
-ALL_BINDINGS = {
+# Grouped node types - defined outside the enum to avoid enum member confusion.
+# Frozen because rules keep a reference to them as their default target_node_types.
+ALL_BINDINGS = frozenset({
 	NodeType.EXPRESSION_BINDING, NodeType.EXPRESSION_STRUCT_BINDING, NodeType.PROPERTY_BINDING,
 	NodeType.TAG_BINDING, NodeType.QUERY_BINDING
-}
-ALL_SCRIPTS = {NodeType.MESSAGE_HANDLER, NodeType.CUSTOM_METHOD, NodeType.TRANSFORM, NodeType.EVENT_HANDLER}
+})
+ALL_SCRIPTS = frozenset({NodeType.MESSAGE_HANDLER, NodeType.CUSTOM_METHOD, NodeType.TRANSFORM, NodeType.EVENT_HANDLER})
 
 
 class ViewNode(ABC):
@@ -196,6 +198,32 @@ class QueryBinding(ViewNode):
 		return list(self.parameters.keys())
 
 
+@functools.lru_cache(maxsize=1024)
+def _indent_script_body(script: str) -> str:
+	"""
+	Indent a script body to sit under a function definition.
+
+	Cached on the script text because views often repeat the same transform across many components.
+
+	Args:
+		script: Raw script body from the view
+
+	Returns:
+		The script unchanged if it is already indented, otherwise with a tab added to each non-blank line
+	"""
+	# Check if script is already indented by looking at first non-empty, non-comment line
+	lines = script.split('\n')
+	first_code_line = next((line for line in lines if line.strip() and not line.strip().startswith('#')), None)
+	already_indented = first_code_line and (first_code_line.startswith('\t') or first_code_line.startswith('    '))
+
+	if already_indented:
+		# Script already has indentation - use as-is
+		return script
+
+	# Script needs indentation - add tab to each line
+	return '\n'.join('\t' + line if line.strip() else '' for line in lines)
+
+
 class ScriptNode(ViewNode):
 	"""Base class for all script-containing nodes."""
 
@@ -209,21 +237,7 @@ class ScriptNode(ViewNode):
 		if not self.script.strip():
 			self.script = "\tpass"
 
-		# Check if script is already indented by looking at first non-empty, non-comment line
-		lines = self.script.split('\n')
-		first_code_line = next((line for line in lines if line.strip() and not line.strip().startswith('#')),
-					None)
-		already_indented = first_code_line and (
-			first_code_line.startswith('\t') or first_code_line.startswith('    ')
-		)
-
-		if already_indented:
-			# Script already has indentation - use as-is
-			return f"{self.function_def}\n{self.script}"
-
-		# Script needs indentation - add tab to each line
-		indented_script = '\n'.join('\t' + line if line.strip() else '' for line in lines)
-		return f"{self.function_def}\n{indented_script}"
+		return f"{self.function_def}\n{_indent_script_body(self.script)}"
 
 	def _get_serializable_attrs(self) -> Dict[str, Any]:
 		return {
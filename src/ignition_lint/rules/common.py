@@ -10,7 +10,8 @@ from ..common.fix_operations import Fix
 
 # Type definition for severity levels
 Severity = Literal["warning", "error"]
-RESERVED_KEY_NAMES = {"_JavaDate"}
+VALID_SEVERITIES = frozenset({"warning", "error"})
+RESERVED_KEY_NAMES = frozenset({"_JavaDate"})
 
 
 @dataclass
@@ -78,7 +79,7 @@ class LintingRule(NodeVisitor):
 			include_private_properties: Whether to include properties starting with '_' (default: False)
 		"""
 		self.target_node_types = target_node_types or set()
-		self.severity = severity if severity in ["warning", "error"] else "error"
+		self.severity = severity if severity in VALID_SEVERITIES else "error"
 		self.include_private_properties = include_private_properties
 		self.errors = []
 		self.warnings = []
@@ -157,7 +158,7 @@ class LintingRule(NodeVisitor):
 			message: The violation message
 			severity: Override the default severity ("warning" or "error")
 		"""
-		actual_severity = severity if severity in ["warning", "error"] else self.severity
+		actual_severity = severity if severity in VALID_SEVERITIES else self.severity
 		if actual_severity == "error":
 			self.errors.append(message)
 		else:
@@ -4,7 +4,7 @@ Fixed NamePatternRule that properly handles node-specific pattern configurations
 import re
 from typing import Dict, Optional, Set, Callable, Any
 from dataclasses import dataclass
-from ..common import LintingRule, FixableMixin
+from ..common import LintingRule, FixableMixin, VALID_SEVERITIES
 from ...model.node_types import ViewNode, NodeType
 from ...common.fix_operations import Fix, FixOperation, FixOperationType
 from ...common.reference_finder import ComponentReferenceFinder
@@ -35,7 +35,7 @@ class NamePatternConfig:
 			self.allowed_abbreviations = set(self.allowed_abbreviations)
 
 		# Validate severity
-		if self.severity not in ("warning", "error"):
+		if self.severity not in VALID_SEVERITIES:
 			raise ValueError(f"severity must be 'warning' or 'error', got '{self.severity}'")
 
 
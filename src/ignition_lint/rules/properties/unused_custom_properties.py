@@ -38,6 +38,24 @@ from ..common import LintingRule
 from ..registry import register_rule
 from ...model.node_types import NodeType
 
+# Property references in expressions, tag paths and property binding paths, with the
+# used-property prefix each one maps to ("*" marks a reference from any component)
+EXPRESSION_REFERENCE_PATTERNS = (
+	(re.compile(r'\{view\.custom\.([^}]+)\}'), "view.custom."),  # {view.custom.propName}
+	(re.compile(r'\{view\.params\.([^}]+)\}'), "view.params."),  # {view.params.paramName}
+	(re.compile(r'\{this\.custom\.([^}]+)\}'), "*.custom."),  # {this.custom.propName}
+	(re.compile(r'\{self\.view\.custom\.([^}]+)\}'), "view.custom."),  # {self.view.custom.propName}
+	(re.compile(r'\{self\.view\.params\.([^}]+)\}'), "view.params."),  # {self.view.params.paramName}
+)
+
+# Property references in scripts, mapped the same way
+SCRIPT_REFERENCE_PATTERNS = (
+	(re.compile(r'self\.view\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)'), "view.custom."),  # self.view.custom.propName
+	(re.compile(r'self\.view\.params\.([a-zA-Z_][a-zA-Z0-9_]*)'), "view.params."),  # self.view.params.paramName
+	(re.compile(r'self\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)'), "*.custom."),  # self.custom.propName (component)
+	(re.compile(r'self\.params\.([a-zA-Z_][a-zA-Z0-9_]*)'), "*.params."),  # self.params.propName (component)
+)
+
 
 @register_rule
 class UnusedCustomPropertiesRule(LintingRule):
@@ -217,21 +235,9 @@ class UnusedCustomPropertiesRule(LintingRule):
 			return
 
 		# Look for patterns like {view.custom.propName}, {this.custom.propName}, etc.
-		pattern_handlers = [
-			(r'\{view\.custom\.([^}]+)\}', lambda m: f"view.custom.{m}"),  # {view.custom.propName}
-			(r'\{view\.params\.([^}]+)\}', lambda m: f"view.params.{m}"),  # {view.params.paramName}
-			(r'\{this\.custom\.([^}]+)\}', lambda m: f"*.custom.{m}"),  # {this.custom.propName}
-			(r'\{self\.view\.custom\.([^}]+)\}',
-				lambda m: f"view.custom.{m}"),  # {self.view.custom.propName}
-			(r'\{self\.view\.params\.([^}]+)\}',
-				lambda m: f"view.params.{m}"),  # {self.view.params.paramName}
-		]
-
-		for pattern, handler in pattern_handlers:
-			matches = re.findall(pattern, expression)
-			for match in matches:
-				used_prop = handler(match)
-				self.used_properties.add(used_prop)
+		for pattern, used_prefix in EXPRESSION_REFERENCE_PATTERNS:
+			for match in pattern.findall(expression):
+				self.used_properties.add(f"{used_prefix}{match}")
 
 	def _check_script_for_references(self, script: str):
 		"""Check a script string for custom property references."""
@@ -239,25 +245,9 @@ class UnusedCustomPropertiesRule(LintingRule):
 			return
 
 		# Look for patterns like self.view.custom.propName, self.view.params.paramName, etc.
-		patterns = [
-			r'self\.view\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)',  # self.view.custom.propName
-			r'self\.view\.params\.([a-zA-Z_][a-zA-Z0-9_]*)',  # self.view.params.paramName
-			r'self\.custom\.([a-zA-Z_][a-zA-Z0-9_]*)',  # self.custom.propName (component)
-			r'self\.params\.([a-zA-Z_][a-zA-Z0-9_]*)',  # self.params.propName (component)
-		]
-
-		for pattern in patterns:
-			matches = re.findall(pattern, script)
-			for match in matches:
-				# Check for escaped versions of the substrings since patterns have escaped dots
-				if r'\.view\.custom\.' in pattern:
-					self.used_properties.add(f"view.custom.{match}")
-				elif r'\.view\.params\.' in pattern:
-					self.used_properties.add(f"view.params.{match}")
-				elif r'\.custom\.' in pattern:
-					self.used_properties.add(f"*.custom.{match}")
-				elif r'\.params\.' in pattern:
-					self.used_properties.add(f"*.params.{match}")
+		for pattern, used_prefix in SCRIPT_REFERENCE_PATTERNS:
+			for match in pattern.findall(script):
+				self.used_properties.add(f"{used_prefix}{match}")
 
 	def finalize(self):
 		"""Called after all nodes are visited - check for unused properties."""
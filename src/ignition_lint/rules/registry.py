@@ -7,6 +7,7 @@ to register new linting rules without modifying core framework files.
 
 import inspect
 import importlib
+import sys
 from pathlib import Path
 from typing import Dict, Type, Set, Optional, List, Any
 from .common import LintingRule
@@ -43,8 +44,8 @@ class RuleRegistry:
 		Raises:
 			RuleValidationError: If the rule fails validation
 		"""
-		if not rule_name:
-			rule_name = rule_class.__name__
+		# Intern so rule-name dict lookups (RULES_MAP, results by rule) hit the identity fast path
+		rule_name = sys.intern(rule_name or rule_class.__name__)
 
 		# Validate the rule
 		self._validate_rule(rule_class, rule_name)
@@ -20,13 +20,50 @@ from pylint.reporters.text import TextReporter
 from ..common import ScriptRule
 from ...model.node_types import ScriptNode
 
+# Pylint message categories in display order, with their human-readable names
+PYLINT_CATEGORY_NAMES = {
+	'F': 'Fatal',
+	'E': 'Error',
+	'W': 'Warning',
+	'C': 'Convention',
+	'R': 'Refactor',
+}
 
-@dataclass
+# Pylint text output line, e.g. test.py:10:5: E0602: Undefined variable 'x' (undefined-variable)
+PYLINT_OUTPUT_LINE_PATTERN = re.compile(r'.*:(\d+):\d+: ([EWCRF]\d+): (.+)')
+
+
+def split_pylint_output_line(line: str) -> Optional[Tuple[int, str, str]]:
+	"""
+	Split a pylint text output line into its line number, message code and message.
+
+	PYLINT_OUTPUT_LINE_PATTERN is the only parser: its greedy prefix anchors on the last
+	':line:col: CODE: ' in the line, which first-separator string splitting can't reproduce.
+	Every match contains ': ', so lines without one (module headers, the score line) are
+	rejected without running the regex.
+
+	Args:
+		line: One line of pylint text output
+
+	Returns:
+		Tuple of (line number, code, message), or None if the line is not a message
+	"""
+	if ': ' not in line:
+		return None
+
+	match = PYLINT_OUTPUT_LINE_PATTERN.match(line)
+	if not match:
+		return None
+	return int(match.group(1)), match.group(2), match.group(3)
+
+
+@dataclass(slots=True)
 class PylintViolation:
 	"""
 	Structured data for a pylint violation.
 
 	This is a specialized violation type for pylint that stores category-specific information.
+	Slotted because large scans can accumulate thousands of these on a single rule.
 	"""
 	category: str  # E, W, C, R, F
 	code: str  # E0602, W0611, etc.
@@ -141,6 +178,10 @@ class PylintScriptRule(ScriptRule):
 			self.collected_scripts = {}
 		# In batch mode: don't reset anything - accumulate across all files
 
+		# Nothing to collect, and post_process has no pending scripts after the reset above
+		if not nodes:
+			return
+
 		# Filter nodes that this rule applies to
 		applicable_nodes = [node for node in nodes if self.applies_to(node)]
 
@@ -194,31 +235,28 @@ class PylintScriptRule(ScriptRule):
 				...
 			}
 		"""
-		category_names = {
-			'F': 'Fatal',
-			'E': 'Error',
-			'W': 'Warning',
-			'C': 'Convention',
-			'R': 'Refactor',
-		}
-
-		# Group violations by category
-		grouped = {}
+		# Group violations by category in a single pass
+		messages_by_category: Dict[str, List[str]] = {}
+		formatted_paths: Dict[str, str] = {}
 		for violation in self.pylint_violations:
-			if violation.category not in grouped:
-				grouped[violation.category] = {
-					'severity': self.category_mapping.get(violation.category, self.severity),
-					'name': category_names.get(violation.category, violation.category),
-					'violations': []
-				}
-
-			formatted_path = self._format_script_path(violation.path)
-			message = f"{formatted_path}: Line {violation.line}: {violation.message} ({violation.code})"
-			grouped[violation.category]['violations'].append(message)
-
-		# Sort categories: F, E, W, C, R
-		category_order = ['F', 'E', 'W', 'C', 'R']
-		return {cat: grouped[cat] for cat in category_order if cat in grouped}
+			formatted_path = formatted_paths.get(violation.path)
+			if formatted_path is None:
+				formatted_path = formatted_paths[violation.path] = self._format_script_path(violation.path)
+			messages_by_category.setdefault(violation.category, []).append(
+				f"{formatted_path}: Line {violation.line}: {violation.message} ({violation.code})"
+			)
+
+		# Emit categories in F, E, W, C, R order
+		mapping = self.category_mapping
+		return {
+			category: {
+				'severity': mapping.get(category, self.severity),
+				'name': name,
+				'violations': messages_by_category[category],
+			}
+			for category, name in PYLINT_CATEGORY_NAMES.items()
+			if category in messages_by_category
+		}
 
 	def format_violations_grouped(self) -> Optional[Dict[str, str]]:
 		"""
@@ -241,18 +279,11 @@ class PylintScriptRule(ScriptRule):
 
 		# Format each category, splitting by severity
 		for category, data in grouped.items():
-			# Category header (no emoticons for cleaner output)
-			category_output = [f"\n    Pylint - {data['name']} ({category}):"]
+			target_lines = errors_lines if data['severity'] == "error" else warnings_lines
 
-			# Violations
-			for violation in data['violations']:
-				category_output.append(f"      • {violation}")
-
-			# Add to appropriate severity list
-			if data['severity'] == "error":
-				errors_lines.extend(category_output)
-			else:
-				warnings_lines.extend(category_output)
+			# Category header (no emoticons for cleaner output), then its violations
+			target_lines.append(f"\n    Pylint - {data['name']} ({category}):")
+			target_lines.extend([f"      • {violation}" for violation in data['violations']])
 
 		return {
 			"warnings": '\n'.join(warnings_lines) if warnings_lines else None,
@@ -498,18 +529,13 @@ class PylintScriptRule(ScriptRule):
 		self, output: str, line_map: Dict[int, str], path_to_issues: Dict[str, List[str]]
 	) -> None:
 		"""Parse pylint output and map issues back to original scripts."""
-		# Enhanced pattern to capture category and code: E0602, W0611, etc.
-		# Example line: test.py:10:5: E0602: Undefined variable 'x' (undefined-variable)
-		pattern = r'.*:(\d+):\d+: ([EWCRF]\d+): (.+)'
 		for line in output.splitlines():
-			match = re.match(pattern, line)
-			if not match:
+			parsed = split_pylint_output_line(line)
+			if not parsed:
 				continue
 
 			try:
-				line_num = int(match.group(1))
-				code = match.group(2)  # E0602, W0611, etc.
-				message = match.group(3)  # Rest of the message
+				line_num, code, message = parsed  # code: E0602, W0611, etc.
 				category = code[0]  # E, W, C, R, or F
 
 				script_path = self._find_script_for_line(line_num, line_map)
@@ -1,13 +1,38 @@
 # tests/fixtures/__init__.py
 """
 Test fixtures and utilities for ignition-lint tests.
+
+Exports are imported on first access, so lightweight modules such as fixtures.test_helpers
+can be imported (e.g. by test_runner.py) without loading the rule engine.
 """
 
-from .base_test import BaseRuleTest, BaseIntegrationTest
-from .test_helpers import (create_mock_view, assert_rule_errors, assert_no_errors, get_test_config)
-from .config_framework import ConfigurableTestFramework
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .base_test import BaseRuleTest, BaseIntegrationTest
+	from .test_helpers import (create_mock_view, assert_rule_errors, assert_no_errors, get_test_config)
+	from .config_framework import ConfigurableTestFramework
+
+# Exported name -> fixtures submodule that defines it
+_EXPORTS = {
+	'BaseRuleTest': 'base_test',
+	'BaseIntegrationTest': 'base_test',
+	'create_mock_view': 'test_helpers',
+	'assert_rule_errors': 'test_helpers',
+	'assert_no_errors': 'test_helpers',
+	'get_test_config': 'test_helpers',
+	'ConfigurableTestFramework': 'config_framework',
+}
 
 __all__ = [
 	'BaseRuleTest', 'BaseIntegrationTest', 'create_mock_view', 'assert_rule_errors', 'assert_no_errors',
 	'get_test_config', 'ConfigurableTestFramework'
 ]
+
+
+def __getattr__(name):
+	"""Import an exported fixture from its submodule on first access."""
+	if name not in _EXPORTS:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
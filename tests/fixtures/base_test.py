@@ -4,31 +4,62 @@ Base test classes providing common functionality for ignition-lint tests.
 """
 
 import unittest
+import copy
+import hashlib
+import json
 import os
+import re
 import sys
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List
 
 # Add the src directory to the PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
 from ignition_lint.linter import LintEngine
 from ignition_lint.rules import RULES_MAP
-from ignition_lint.common.flatten_json import flatten_file
+from ignition_lint.common.flatten_json import flatten_dict, flatten_file
+from .test_helpers import LINT_CACHE_ENABLED_ENV, dump_view_json, flatten_test_view
 
+# Lint results keyed by (view content hash, rule config hash). Lives for a single
+# test run only, since rule code changes are not part of the key.
+_LINT_RESULTS_CACHE: Dict[tuple, Any] = {}
 
-class BaseRuleTest(unittest.TestCase):
+
+# Flattened in-memory views keyed by their canonical JSON text. Flattening doesn't
+# depend on rule code, so this is kept even when the lint results cache is disabled.
+_FLATTENED_VIEWS: Dict[str, Dict[str, Any]] = {}
+
+
+# The unittest setUp/setUpClass hooks count toward the public-method limit alongside the helper API
+class BaseRuleTest(unittest.TestCase):  # pylint: disable=too-many-public-methods
 	"""Base class for testing individual linting rules."""
 	test_cases_dir: Path
 	configs_dir: Path
+	view_dir: Path  # Generated view files for the class, created in setUpClass
 	rule_config: Dict[str, Dict[str, Any]] | None
 	last_results: Any | None
+	# Opt in to reusing one LintEngine per rule config across the class's run_lint_on_* calls.
+	# Only safe for rules whose process_nodes() resets all per-view state.
+	share_lint_engine = False
 
 	def __init__(self, methodName='runTest'):
 		super().__init__(methodName)
 		self.rule_config = None
 		self.last_results = None  # Store results from last run_lint call
+		self.view_file_count = 0  # Numbers the view files written by this test
+
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Create the class's generated view directory and its shared lint engine cache."""
+		super().setUpClass()
+		# Outlives this method; the class cleanup removes it once every test in the class has run
+		view_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+		cls.addClassCleanup(view_dir.cleanup)
+		cls.view_dir = Path(view_dir.name)
+		# Engines reused across the class's tests when share_lint_engine is set, keyed by canonical config JSON
+		cls._shared_engines = {}
 
 	def setUp(self): # pylint: disable=invalid-name
 		"""Set up test fixtures."""
@@ -77,11 +108,109 @@ class BaseRuleTest(unittest.TestCase):
 		if not view_file.exists():
 			self.skipTest(f"View file not found: {view_file}")
 
-		lint_engine = self.create_lint_engine(rule_configs)
-		flattened_json = flatten_file(view_file)
-		self.last_results = lint_engine.process(flattened_json)
+		def flatten():
+			if view_file.is_relative_to(self.test_cases_dir):
+				# Static case views are parsed once per run and shared read-only
+				return flatten_test_view(view_file)
+			return flatten_file(view_file)
+
+		return self._run_lint_cached(view_file.read_bytes(), rule_configs, flatten)
+
+	def _run_lint_on_view_data(self, view_data: Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]]):
+		"""
+		Run linting on in-memory view data without writing a view file.
+
+		Args:
+			view_data: View JSON data
+			rule_configs: Rule configurations
+
+		Returns:
+			LintResults object with separate warnings and errors
+		"""
+		# Sorted keys make equal views share one cache entry however their dicts were built
+		view_json = json.dumps(view_data, sort_keys=True)
+
+		def flatten():
+			# Flatten the dict directly; the JSON text is only needed as a cache key
+			if view_json not in _FLATTENED_VIEWS:
+				_FLATTENED_VIEWS[view_json] = flatten_dict(view_data)
+			return _FLATTENED_VIEWS[view_json]
+
+		return self._run_lint_cached(view_json.encode('utf-8'), rule_configs, flatten)
+
+	def _run_lint_on_view(self, view: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]]):
+		"""Run linting on either a view file path or in-memory view data."""
+		if isinstance(view, Path):
+			return self.run_lint_on_file(view, rule_configs)
+		return self._run_lint_on_view_data(view, rule_configs)
+
+	def _run_lint_cached(
+		self, view_bytes: bytes, rule_configs: Dict[str, Dict[str, Any]], flatten: Callable[[], Dict[str, Any]]
+	):
+		"""
+		Lint a view, reusing earlier results for identical view contents and rule configs.
+
+		Args:
+			view_bytes: Serialized view contents, used for the cache key
+			rule_configs: Rule configurations
+			flatten: Callable returning the flattened view, only invoked on a cache miss
+
+		Returns:
+			LintResults object with separate warnings and errors
+		"""
+		use_cache = bool(os.environ.get(LINT_CACHE_ENABLED_ENV))
+		cache_key = (
+			hashlib.sha256(view_bytes).digest(),
+			json.dumps(rule_configs, sort_keys=True, default=repr),
+		)
+		cached_results = _LINT_RESULTS_CACHE.get(cache_key) if use_cache else None
+		if cached_results is not None:
+			self.last_results = copy.deepcopy(cached_results)
+			return self.last_results
+
+		lint_engine = self._get_lint_engine(rule_configs, cache_key[1])
+		results = lint_engine.process(flatten())
+		if use_cache:
+			_LINT_RESULTS_CACHE[cache_key] = results
+		self.last_results = copy.deepcopy(results)
 		return self.last_results
 
+	def _get_lint_engine(self, rule_configs: Dict[str, Dict[str, Any]], config_key: str) -> LintEngine:
+		"""
+		Get a lint engine for the rule configs, reusing the class's engine when share_lint_engine is set.
+
+		Args:
+			rule_configs: Rule configurations
+			config_key: Canonical JSON of rule_configs, identifying the shared engine
+
+		Returns:
+			Configured LintEngine instance
+		"""
+		if not self.share_lint_engine:
+			return self.create_lint_engine(rule_configs)
+		if config_key not in self._shared_engines:
+			self._shared_engines[config_key] = self.create_lint_engine(rule_configs)
+		return self._shared_engines[config_key]
+
+	def _next_view_file(self) -> Path:
+		"""Return a fresh, deterministically named view file path for the current test."""
+		self.view_file_count += 1
+		return self.view_dir / f"{self._testMethodName}_{self.view_file_count}.json"
+
+	def create_view_file(self, view_data: Dict[str, Any]) -> Path:
+		"""
+		Write view data to a view.json file in the class's temporary directory.
+
+		Args:
+			view_data: View JSON data to write
+
+		Returns:
+			Path to the written view file
+		"""
+		view_file = self._next_view_file()
+		view_file.write_text(dump_view_json(view_data), encoding='utf-8')
+		return view_file
+
 	def run_lint_on_mock_view(self, mock_view_content: str, rule_configs: Dict[str, Dict[str, Any]]):
 		"""
 		Run linting on mock view JSON content and store results for convenience method access.
@@ -93,16 +222,10 @@ class BaseRuleTest(unittest.TestCase):
 		Returns:
 			LintResults object with separate warnings and errors
 		"""
-		# Create a temporary file with the mock content
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			f.write(mock_view_content)
-			temp_file = Path(f.name)
-
-		try:
-			return self.run_lint_on_file(temp_file, rule_configs)
-		finally:
-			# Clean up the temporary file
-			temp_file.unlink(missing_ok=True)
+		# Write the mock content into the class's temporary view directory
+		view_file = self._next_view_file()
+		view_file.write_text(mock_view_content, encoding='utf-8')
+		return self.run_lint_on_file(view_file, rule_configs)
 
 	# Convenience methods for accessing results from last run_lint call
 	def get_error_count(self, rule_name: str = None) -> int:
@@ -149,9 +272,9 @@ class BaseRuleTest(unittest.TestCase):
 		self.assertEqual(error_count + warning_count, 0,
 			f"Expected no issues for {scope} but found {error_count} errors and {warning_count} warnings")
 
-	def assert_rule_passes(self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str):
+	def assert_rule_passes(self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str):
 		"""Assert that a rule passes (no errors) for a given view file. Warnings are allowed."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		error_count = self.get_error_count(rule_name)
 		self.assertEqual(error_count, 0, f"Rule {rule_name} should pass but found {error_count} errors: {self.get_errors_for_rule(rule_name)}")
@@ -160,11 +283,11 @@ class BaseRuleTest(unittest.TestCase):
 			print(f"Note: Rule {rule_name} passed but produced warnings: {self.get_warnings_for_rule(rule_name)}")
 
 	def assert_rule_fails(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_error_count: int = None
 	):
 		"""Assert that a rule fails (has errors) for a given view file."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		error_count = self.get_error_count(rule_name)
 		self.assertGreater(error_count, 0, f"Rule {rule_name} should fail but found no errors")
@@ -176,10 +299,10 @@ class BaseRuleTest(unittest.TestCase):
 			)
 
 	def assert_error_contains(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str, error_pattern: str
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str, error_pattern: str
 	):
 		"""Assert that rule errors contain a specific pattern."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		rule_errors = self.get_errors_for_rule(rule_name)
 		matching_errors = [error for error in rule_errors if error_pattern in error]
@@ -190,8 +313,29 @@ class BaseRuleTest(unittest.TestCase):
 
 	# Detailed assertion methods for warnings and errors
 
+	def _assert_messages_match(
+		self, rule_name: str, kind: str, messages: List[str], patterns: List[str | re.Pattern] | None
+	):
+		"""
+		Assert that every pattern matches at least one of a rule's messages.
+
+		Args:
+			rule_name: Rule the messages belong to, for the failure message
+			kind: "warnings" or "errors", for the failure message
+			messages: Messages reported by the rule
+			patterns: Substrings, or compiled regexes matched with search(); None to skip the check
+		"""
+		for pattern in patterns or ():
+			if isinstance(pattern, re.Pattern):
+				found = any(pattern.search(message) for message in messages)
+				description = pattern.pattern
+			else:
+				found = any(pattern in message for message in messages)
+				description = pattern
+			self.assertTrue(found, f"Rule {rule_name} {kind} should contain '{description}'. Found {kind}: {messages}")
+
 	def assert_violations(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warnings: int = 0, expected_errors: int = 0,
 		warning_patterns: list = None, error_patterns: list = None
 	):
@@ -199,7 +343,7 @@ class BaseRuleTest(unittest.TestCase):
 		Assert the total warnings and errors count for a rule with optional pattern matching.
 		Convenience method for comprehensive rule validation.
 		"""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		warning_count = self.get_warning_count(rule_name)
 		error_count = self.get_error_count(rule_name)
@@ -216,29 +360,17 @@ class BaseRuleTest(unittest.TestCase):
 		)
 
 		# Check warning patterns if provided
-		if warning_patterns:
-			for pattern in warning_patterns:
-				matching_warnings = [warning for warning in rule_warnings if pattern in warning]
-				self.assertGreater(
-					len(matching_warnings), 0,
-					f"Rule {rule_name} warnings should contain '{pattern}'. Found warnings: {rule_warnings}"
-				)
+		self._assert_messages_match(rule_name, "warnings", rule_warnings, warning_patterns)
 
 		# Check error patterns if provided
-		if error_patterns:
-			for pattern in error_patterns:
-				matching_errors = [error for error in rule_errors if pattern in error]
-				self.assertGreater(
-					len(matching_errors), 0,
-					f"Rule {rule_name} errors should contain '{pattern}'. Found errors: {rule_errors}"
-				)
+		self._assert_messages_match(rule_name, "errors", rule_errors, error_patterns)
 
 	def assert_rule_warnings(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warning_count: int, warning_patterns: list = None
 	):
 		"""Assert that a rule produces the expected number of warnings with optional pattern matching."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		warning_count = self.get_warning_count(rule_name)
 		rule_warnings = self.get_warnings_for_rule(rule_name)
@@ -248,20 +380,14 @@ class BaseRuleTest(unittest.TestCase):
 			f"Rule {rule_name} should produce {expected_warning_count} warnings but produced {warning_count}: {rule_warnings}"
 		)
 
-		if warning_patterns:
-			for pattern in warning_patterns:
-				matching_warnings = [warning for warning in rule_warnings if pattern in warning]
-				self.assertGreater(
-					len(matching_warnings), 0,
-					f"Rule {rule_name} warnings should contain '{pattern}'. Found warnings: {rule_warnings}"
-				)
+		self._assert_messages_match(rule_name, "warnings", rule_warnings, warning_patterns)
 
 	def assert_rule_errors(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_error_count: int, error_patterns: list = None
 	):
 		"""Assert that a rule produces the expected number of errors with optional pattern matching."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		error_count = self.get_error_count(rule_name)
 		rule_errors = self.get_errors_for_rule(rule_name)
@@ -271,27 +397,21 @@ class BaseRuleTest(unittest.TestCase):
 			f"Rule {rule_name} should produce {expected_error_count} errors but produced {error_count}: {rule_errors}"
 		)
 
-		if error_patterns:
-			for pattern in error_patterns:
-				matching_errors = [error for error in rule_errors if pattern in error]
-				self.assertGreater(
-					len(matching_errors), 0,
-					f"Rule {rule_name} errors should contain '{pattern}'. Found errors: {rule_errors}"
-				)
+		self._assert_messages_match(rule_name, "errors", rule_errors, error_patterns)
 
 	def assert_rule_passes_completely(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str
 	):
 		"""Assert that a rule passes completely (no warnings or errors)."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 		self.assert_no_issues(rule_name)
 
 	def assert_rule_summary(
-		self, view_file: Path, rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
+		self, view_file: Path | Dict[str, Any], rule_configs: Dict[str, Dict[str, Any]], rule_name: str,
 		expected_warnings: int = 0, expected_errors: int = 0
 	):
 		"""Assert the total warnings and errors count for a rule."""
-		self.run_lint_on_file(view_file, rule_configs)
+		self._run_lint_on_view(view_file, rule_configs)
 
 		warning_count = self.get_warning_count(rule_name)
 		error_count = self.get_error_count(rule_name)
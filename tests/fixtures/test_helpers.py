@@ -2,11 +2,44 @@
 Helper functions and utilities for ignition-lint tests.
 """
 
+import atexit
+import functools
 import json
+import os
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Dict, Any, List
 
+from ignition_lint.common.flatten_json import flatten_file
+
+# Set to pretty-print generated view JSON when inspecting a failing test's fixtures
+_DEBUG_FIXTURES_ENV = "IGNITION_LINT_DEBUG_FIXTURES"
+
+# Set by test_runner.py --lint-cache to reuse lint results; off by default so CI lints every view
+LINT_CACHE_ENABLED_ENV = "IGNITION_LINT_TEST_LINT_CACHE"
+
+# Directory shared by every create_temp_view_file() call, removed when the test process exits
+_TEMP_VIEW_DIR: Path | None = None
+
+
+def dump_view_json(view_data: Dict[str, Any]) -> str:
+	"""
+	Serialize generated view data for the lint helpers.
+
+	Output is compact so json.dumps stays on its C encoder (any indent forces the
+	pure-Python one). Set IGNITION_LINT_DEBUG_FIXTURES=1 to indent it for reading.
+
+	Args:
+		view_data: View JSON data
+
+	Returns:
+		JSON string representing the view
+	"""
+	if os.environ.get(_DEBUG_FIXTURES_ENV):
+		return json.dumps(view_data, indent=2)
+	return json.dumps(view_data)
+
 
 def create_mock_view(components: List[Dict[str, Any]], custom_properties: Dict[str, Any] = None) -> str:
 	"""
@@ -44,22 +77,35 @@ def create_mock_view(components: List[Dict[str, Any]], custom_properties: Dict[s
 
 		view_data["props"]["children"] = children
 
-	return json.dumps(view_data, indent=2)
+	return dump_view_json(view_data)
 
 
-def create_temp_view_file(view_content: str) -> Path:
+def create_temp_view_file(view_content: str | Dict[str, Any]) -> Path:
 	"""
 	Create a temporary view.json file with the given content.
 
 	Args:
-		view_content: JSON content for the view file
+		view_content: JSON content for the view file, or view data to serialize
+			with dump_view_json().
+
+	Files are written to one temporary directory per test process, which is removed
+	at exit, so callers don't need to delete them.
 
 	Returns:
 		Path to the temporary file
 	"""
-	with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+	global _TEMP_VIEW_DIR  # pylint: disable=global-statement
+	if _TEMP_VIEW_DIR is None:
+		_TEMP_VIEW_DIR = Path(tempfile.mkdtemp(prefix='ignition_lint_views_'))
+		atexit.register(shutil.rmtree, _TEMP_VIEW_DIR, ignore_errors=True)
+
+	if not isinstance(view_content, str):
+		view_content = dump_view_json(view_content)
+	# mkstemp picks a unique name even when forked --jobs workers inherit the directory
+	fd, view_path = tempfile.mkstemp(suffix='.json', prefix='view_', dir=_TEMP_VIEW_DIR)
+	with os.fdopen(fd, 'w', encoding='utf-8') as f:
 		f.write(view_content)
-		return Path(f.name)
+	return Path(view_path)
 
 
 def assert_rule_errors(
@@ -103,10 +149,19 @@ def assert_no_errors(errors: Dict[str, List[str]], rule_name: str = None):
 		assert total_errors == 0, f"Should have no errors but found: {errors}"
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_test_config(rule_name: str, kwargs_items: tuple) -> Dict[str, Dict[str, Any]]:
+	"""Build and cache the test configuration for hashable rule keyword arguments."""
+	return {rule_name: {"enabled": True, "kwargs": dict(kwargs_items)}}
+
+
 def get_test_config(rule_name: str, **kwargs) -> Dict[str, Dict[str, Any]]:
 	"""
 	Create a test configuration for a specific rule.
 
+	Configurations with hashable keyword arguments are cached and shared between
+	callers, so treat the result as read-only.
+
 	Args:
 		rule_name: Name of the rule
 		**kwargs: Keyword arguments for the rule
@@ -114,13 +169,35 @@ def get_test_config(rule_name: str, **kwargs) -> Dict[str, Dict[str, Any]]:
 	Returns:
 		Configuration dictionary
 	"""
-	return {rule_name: {"enabled": True, "kwargs": kwargs}}
+	try:
+		return _cached_test_config(rule_name, tuple(sorted(kwargs.items())))
+	except TypeError:
+		# Unhashable values such as lists can't be cache keys; build a fresh config
+		return {rule_name: {"enabled": True, "kwargs": kwargs}}
+
+
+def get_test_view_path(test_cases_dir: Path, case_name: str) -> Path:
+	"""
+	Get the expected view file path for a test case without checking that it exists.
+
+	Args:
+		test_cases_dir: Path to test cases directory
+		case_name: Name of the test case subdirectory
+
+	Returns:
+		Path to where the case's view.json should be
+	"""
+	return test_cases_dir / case_name / "view.json"
 
 
+@functools.lru_cache(maxsize=None)
 def load_test_view(test_cases_dir: Path, case_name: str) -> Path:
 	"""
 	Load a test view file by case name.
 
+	Results are cached per (test_cases_dir, case_name) since the case files are
+	static for the lifetime of a test run.
+
 	Args:
 		test_cases_dir: Path to test cases directory
 		case_name: Name of the test case subdirectory
@@ -128,7 +205,7 @@ def load_test_view(test_cases_dir: Path, case_name: str) -> Path:
 	Returns:
 		Path to the view.json file
 	"""
-	view_file = test_cases_dir / case_name / "view.json"
+	view_file = get_test_view_path(test_cases_dir, case_name)
 	if not view_file.exists():
 		# Debug: show what we're looking for and what exists
 		print(f"Looking for: {view_file}")
@@ -139,6 +216,23 @@ def load_test_view(test_cases_dir: Path, case_name: str) -> Path:
 	return view_file
 
 
+@functools.lru_cache(maxsize=None)
+def flatten_test_view(view_file: Path) -> Dict[str, Any]:
+	"""
+	Flatten a static test case view, caching the result per path.
+
+	The returned dict is shared between callers and must be treated as read-only;
+	use copy.deepcopy() if a test needs to modify it.
+
+	Args:
+		view_file: Path to a view.json file under the test cases directory
+
+	Returns:
+		Sorted flattened JSON data for the view
+	"""
+	return flatten_file(view_file)
+
+
 def create_mock_script(script_type: str, source_code: str, component_name: str = "TestComponent") -> str:
 	"""
 	Create a mock view.json with a script for testing script-based rules.
@@ -279,4 +373,4 @@ def create_mock_script(script_type: str, source_code: str, component_name: str =
 	else:
 		raise ValueError(f"Unknown script type: {script_type}. Available: message_handler, custom_method, transform, event_handler")
 
-	return json.dumps(view_data, indent=2)
+	return dump_view_json(view_data)
@@ -6,6 +6,8 @@ This script provides a simple command-line interface for running organized tests
 """
 
 import argparse
+import concurrent.futures
+import io
 import json
 import os
 import sys
@@ -15,11 +17,92 @@ from pathlib import Path
 # Add the src directory to the PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
+from fixtures.test_helpers import LINT_CACHE_ENABLED_ENV
+
 # ConfigurableTestFramework is used indirectly via test_config_framework.py
 
 
 
-def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
+def iter_test_cases(suite):
+	"""Yield the individual test cases contained in a (possibly nested) test suite."""
+	for test in suite:
+		if isinstance(test, unittest.TestSuite):
+			yield from iter_test_cases(test)
+		else:
+			yield test
+
+
+def run_test_module_isolated(test_dir, module_name, verbosity=2):
+	"""
+	Run the tests in a single module, capturing the runner output.
+
+	Used as a worker by run_test_modules_in_parallel, so it must stay a picklable module-level function.
+
+	Args:
+		test_dir: Top-level directory the module name is relative to
+		module_name: Dotted module name as produced by unittest discovery
+		verbosity: unittest verbosity level
+
+	Returns:
+		Tuple of (was_successful, tests_run, captured_output)
+	"""
+	if str(test_dir) not in sys.path:
+		sys.path.insert(0, str(test_dir))
+	stream = io.StringIO()
+	suite = unittest.TestLoader().loadTestsFromName(module_name)
+	result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+	return result.wasSuccessful(), result.testsRun, stream.getvalue()
+
+
+def run_test_modules_in_parallel(test_dir, suite, verbosity, jobs):
+	"""
+	Run each test module of a discovered suite in its own worker process.
+
+	Test modules are independent (generated views live in per-class temporary directories), so they can
+	run concurrently. Output is printed per module, in discovery order, once each module finishes.
+
+	Args:
+		test_dir: Top-level directory the suite was discovered from
+		suite: Discovered test suite
+		verbosity: unittest verbosity level
+		jobs: Number of worker processes
+
+	Returns:
+		True if every module passed
+	"""
+	# Modules that failed to import show up as _FailedTest cases; run those in-process to report them
+	module_names = []
+	failed_imports = unittest.TestSuite()
+	for test in iter_test_cases(suite):
+		if isinstance(test, unittest.loader._FailedTest):  # pylint: disable=protected-access
+			failed_imports.addTest(test)
+		elif test.__class__.__module__ not in module_names:
+			module_names.append(test.__class__.__module__)
+
+	success = True
+	total_run = 0
+	with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+		futures = [
+			executor.submit(run_test_module_isolated, test_dir, module_name, verbosity)
+			for module_name in module_names
+		]
+		for module_name, future in zip(module_names, futures):
+			module_success, tests_run, output = future.result()
+			print(f"\n--- {module_name} ---")
+			print(output, end="")
+			success = success and module_success
+			total_run += tests_run
+
+	if failed_imports.countTestCases():
+		result = unittest.TextTestRunner(verbosity=verbosity).run(failed_imports)
+		success = success and result.wasSuccessful()
+		total_run += result.testsRun
+
+	print(f"\nRan {total_run} tests across {len(module_names)} modules with {jobs} workers")
+	return success
+
+
+def discover_and_run_unit_tests(test_pattern=None, verbosity=2, jobs=1):
 	"""Discover and run unit tests from the unit/ directory."""
 	test_dir = Path(__file__).parent / "unit"
 	print("=" * 60)
@@ -37,6 +120,9 @@ def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
 	else:
 		suite = loader.discover(str(test_dir), pattern="test_*.py")
 
+	if jobs > 1:
+		return run_test_modules_in_parallel(test_dir, suite, verbosity, jobs)
+
 	# Run tests
 	runner = unittest.TextTestRunner(verbosity=verbosity)
 	result = runner.run(suite)
@@ -204,6 +290,8 @@ def main():
 		python test_runner.py --setup                       # Set up test environment
 		python test_runner.py --test component_naming       # Run specific test by name
 		python test_runner.py --unit-pattern "test_component*" # Run unit tests matching pattern
+		python test_runner.py --run-all --lint-cache        # Reuse results for identical views locally
+		python test_runner.py --run-unit --jobs 4           # Run unit test modules in 4 processes
 	"""
 	)
 
@@ -228,9 +316,20 @@ def main():
 		"--verbose", "-v", action="count", default=1, help="Increase verbosity (use -vv for more verbose)"
 	)
 	parser.add_argument("--quiet", "-q", action="store_true", help="Reduce verbosity")
+	parser.add_argument(
+		"--jobs", "-j", type=int, default=1,
+		help="Run unit test modules in this many worker processes (default: 1, sequential)"
+	)
+	parser.add_argument(
+		"--lint-cache", action="store_true",
+		help="Reuse lint results for identical view contents and rule configs (default: re-lint every view)"
+	)
 
 	args = parser.parse_args()
 
+	if args.lint_cache:
+		os.environ[LINT_CACHE_ENABLED_ENV] = "1"
+
 	# Set verbosity level
 	verbosity = 0 if args.quiet else min(args.verbose, 2)
 
@@ -262,7 +361,7 @@ def main():
 
 	# Run unit tests
 	if run_unit:
-		success = discover_and_run_unit_tests(args.unit_pattern, verbosity) and success
+		success = discover_and_run_unit_tests(args.unit_pattern, verbosity, args.jobs) and success
 
 	# Run integration tests
 	if run_integration:
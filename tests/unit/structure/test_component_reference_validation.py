@@ -5,11 +5,10 @@ Tests validation of component references in expressions, property bindings, and
 """
 
 import unittest
-import json
 from typing import Dict, Any
 
 from fixtures.base_test import BaseRuleTest
-from fixtures.test_helpers import get_test_config, load_test_view
+from fixtures.test_helpers import dump_view_json, get_test_config, load_test_view
 
 
 class TestComponentReferenceValidationRule(BaseRuleTest):
@@ -41,7 +40,7 @@ class TestComponentReferenceValidationRule(BaseRuleTest):
 			},
 			"root": components_json
 		}
-		return json.dumps(view_data, indent=2)
+		return dump_view_json(view_data)
 
 	def test_valid_sibling_reference_in_expression(self):
 		"""Test that valid sibling references in expressions pass validation."""
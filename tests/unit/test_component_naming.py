@@ -665,30 +665,22 @@ class TestNamePatternArrayProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Run the linter
-			self.run_lint_on_file(view_file, rule_config)
-			errors = self.get_errors_for_rule("NamePatternRule")
-
-			# Should have exactly 1 error for MyArrayProperty, not 3 (one per element)
-			self.assertEqual(
-				len(errors), 1, f"Expected 1 error for array property, got {len(errors)}: {errors}"
-			)
-
-			# Error should reference the base property name, not an indexed element
-			self.assertIn("MyArrayProperty", errors[0])
-			self.assertNotIn("[0]", errors[0], "Error should not reference array index [0]")
-			self.assertNotIn("[1]", errors[0], "Error should not reference array index [1]")
-			self.assertNotIn("[2]", errors[0], "Error should not reference array index [2]")
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Run the linter
+		self.run_lint_on_file(view_file, rule_config)
+		errors = self.get_errors_for_rule("NamePatternRule")
+
+		# Should have exactly 1 error for MyArrayProperty, not 3 (one per element)
+		self.assertEqual(
+			len(errors), 1, f"Expected 1 error for array property, got {len(errors)}: {errors}"
+		)
+
+		# Error should reference the base property name, not an indexed element
+		self.assertIn("MyArrayProperty", errors[0])
+		self.assertNotIn("[0]", errors[0], "Error should not reference array index [0]")
+		self.assertNotIn("[1]", errors[0], "Error should not reference array index [1]")
+		self.assertNotIn("[2]", errors[0], "Error should not reference array index [2]")
 
 	def test_array_property_with_valid_name(self):
 		"""Array property with valid name should pass validation."""
@@ -712,18 +704,10 @@ class TestNamePatternArrayProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
+		view_file = self.create_view_file(view_data)
 
-		try:
-			# Array property with valid name should pass
-			self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		# Array property with valid name should pass
+		self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
 
 
 class TestNamePatternCSSProperties(BaseRuleTest):
@@ -757,18 +741,10 @@ class TestNamePatternCSSProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# CSS properties should NOT be flagged as violations
-			self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# CSS properties should NOT be flagged as violations
+		self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
 
 	def test_css_properties_in_element_style_should_pass(self):
 		"""CSS properties in elementStyle (flex repeater) should not be flagged."""
@@ -803,18 +779,10 @@ class TestNamePatternCSSProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# CSS properties should NOT be flagged as violations
-			self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# CSS properties should NOT be flagged as violations
+		self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
 
 	def test_regular_properties_still_validated(self):
 		"""Regular properties (not in style) should still be validated."""
@@ -839,18 +807,10 @@ class TestNamePatternCSSProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
+		view_file = self.create_view_file(view_data)
 
-		try:
-			# Regular properties SHOULD be flagged as violations
-			self.assert_rule_fails(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		# Regular properties SHOULD be flagged as violations
+		self.assert_rule_fails(view_file, rule_config, "NamePatternRule")
 
 
 class TestNamePatternSVGProperties(BaseRuleTest):
@@ -897,18 +857,10 @@ class TestNamePatternSVGProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# SVG path properties should NOT be flagged as violations
-			self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# SVG path properties should NOT be flagged as violations
+		self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
 
 	def test_svg_paths_skipped_but_other_props_validated(self):
 		"""SVG path properties should be skipped while other properties are still validated."""
@@ -936,28 +888,20 @@ class TestNamePatternSVGProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Should fail because of BadPropertyName, but not because of SVG path
-			self.run_lint_on_file(view_file, rule_config)
-			errors = self.get_errors_for_rule("NamePatternRule")
-
-			# Should have exactly 1 error for BadPropertyName
-			self.assertEqual(
-				len(errors), 1, f"Expected 1 error for BadPropertyName, got {len(errors)}: {errors}"
-			)
-
-			# Error should be about BadPropertyName, not SVG path
-			self.assertIn("BadPropertyName", errors[0])
-			self.assertNotIn("props.elements.d", errors[0])
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Should fail because of BadPropertyName, but not because of SVG path
+		self.run_lint_on_file(view_file, rule_config)
+		errors = self.get_errors_for_rule("NamePatternRule")
+
+		# Should have exactly 1 error for BadPropertyName
+		self.assertEqual(
+			len(errors), 1, f"Expected 1 error for BadPropertyName, got {len(errors)}: {errors}"
+		)
+
+		# Error should be about BadPropertyName, not SVG path
+		self.assertIn("BadPropertyName", errors[0])
+		self.assertNotIn("props.elements.d", errors[0])
 
 
 class TestNamePatternPositionProperties(BaseRuleTest):
@@ -1008,18 +952,10 @@ class TestNamePatternPositionProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Position properties should NOT be flagged as violations
-			self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Position properties should NOT be flagged as violations
+		self.assert_rule_passes(view_file, rule_config, "NamePatternRule")
 
 	def test_position_properties_with_custom_properties(self):
 		"""Position properties should be skipped while custom properties are still validated."""
@@ -1047,29 +983,21 @@ class TestNamePatternPositionProperties(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Should fail because of BadPropertyName, but not because of x/y
-			self.run_lint_on_file(view_file, rule_config)
-			errors = self.get_errors_for_rule("NamePatternRule")
-
-			# Should have exactly 1 error for BadPropertyName
-			self.assertEqual(
-				len(errors), 1, f"Expected 1 error for BadPropertyName, got {len(errors)}: {errors}"
-			)
-
-			# Error should be about BadPropertyName, not x or y
-			self.assertIn("BadPropertyName", errors[0])
-			self.assertNotIn("position.x", errors[0])
-			self.assertNotIn("position.y", errors[0])
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Should fail because of BadPropertyName, but not because of x/y
+		self.run_lint_on_file(view_file, rule_config)
+		errors = self.get_errors_for_rule("NamePatternRule")
+
+		# Should have exactly 1 error for BadPropertyName
+		self.assertEqual(
+			len(errors), 1, f"Expected 1 error for BadPropertyName, got {len(errors)}: {errors}"
+		)
+
+		# Error should be about BadPropertyName, not x or y
+		self.assertIn("BadPropertyName", errors[0])
+		self.assertNotIn("position.x", errors[0])
+		self.assertNotIn("position.y", errors[0])
 
 
 class TestNamePatternPerNodeTypeSeverity(BaseRuleTest):
@@ -1105,26 +1033,18 @@ class TestNamePatternPerNodeTypeSeverity(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Run the linter
-			self.run_lint_on_file(view_file, rule_config)
-
-			# Should be in errors, not warnings
-			rule_errors = self.get_errors_for_rule("NamePatternRule")
-			rule_warnings = self.get_warnings_for_rule("NamePatternRule")
-
-			self.assertEqual(len(rule_errors), 1, "Should report as error when severity='error'")
-			self.assertEqual(len(rule_warnings), 0, "Should not report as warning when severity='error'")
-			self.assertIn("badComponent", rule_errors[0])
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Run the linter
+		self.run_lint_on_file(view_file, rule_config)
+
+		# Should be in errors, not warnings
+		rule_errors = self.get_errors_for_rule("NamePatternRule")
+		rule_warnings = self.get_warnings_for_rule("NamePatternRule")
+
+		self.assertEqual(len(rule_errors), 1, "Should report as error when severity='error'")
+		self.assertEqual(len(rule_warnings), 0, "Should not report as warning when severity='error'")
+		self.assertIn("badComponent", rule_errors[0])
 
 	def test_property_warning_severity(self):
 		"""Test that property naming violations are reported as warnings when severity='warning'."""
@@ -1152,26 +1072,18 @@ class TestNamePatternPerNodeTypeSeverity(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Run the linter
-			self.run_lint_on_file(view_file, rule_config)
-
-			# Should be in warnings, not errors
-			rule_errors = self.get_errors_for_rule("NamePatternRule")
-			rule_warnings = self.get_warnings_for_rule("NamePatternRule")
-
-			self.assertEqual(len(rule_errors), 0, "Should not report as error when severity='warning'")
-			self.assertEqual(len(rule_warnings), 1, "Should report as warning when severity='warning'")
-			self.assertIn("BadPropertyName", rule_warnings[0])
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Run the linter
+		self.run_lint_on_file(view_file, rule_config)
+
+		# Should be in warnings, not errors
+		rule_errors = self.get_errors_for_rule("NamePatternRule")
+		rule_warnings = self.get_warnings_for_rule("NamePatternRule")
+
+		self.assertEqual(len(rule_errors), 0, "Should not report as error when severity='warning'")
+		self.assertEqual(len(rule_warnings), 1, "Should report as warning when severity='warning'")
+		self.assertIn("BadPropertyName", rule_warnings[0])
 
 	def test_mixed_severity_per_node_type(self):
 		"""Test that different node types can have different severity levels."""
@@ -1210,31 +1122,23 @@ class TestNamePatternPerNodeTypeSeverity(BaseRuleTest):
 		}
 
 		# Write test view file
-		import json
-		import tempfile
-		from pathlib import Path
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			json.dump(view_data, f)
-			view_file = Path(f.name)
-
-		try:
-			# Run the linter
-			self.run_lint_on_file(view_file, rule_config)
-
-			# Should have 1 error (component) and 1 warning (property)
-			rule_errors = self.get_errors_for_rule("NamePatternRule")
-			rule_warnings = self.get_warnings_for_rule("NamePatternRule")
-
-			self.assertEqual(len(rule_errors), 1, "Should have 1 error for component")
-			self.assertEqual(len(rule_warnings), 1, "Should have 1 warning for property")
-
-			self.assertIn("badComponent", rule_errors[0])
-			self.assertIn("component", rule_errors[0])
-
-			self.assertIn("BadPropertyName", rule_warnings[0])
-			self.assertIn("property", rule_warnings[0])
-		finally:
-			view_file.unlink()
+		view_file = self.create_view_file(view_data)
+
+		# Run the linter
+		self.run_lint_on_file(view_file, rule_config)
+
+		# Should have 1 error (component) and 1 warning (property)
+		rule_errors = self.get_errors_for_rule("NamePatternRule")
+		rule_warnings = self.get_warnings_for_rule("NamePatternRule")
+
+		self.assertEqual(len(rule_errors), 1, "Should have 1 error for component")
+		self.assertEqual(len(rule_warnings), 1, "Should have 1 warning for property")
+
+		self.assertIn("badComponent", rule_errors[0])
+		self.assertIn("component", rule_errors[0])
+
+		self.assertIn("BadPropertyName", rule_warnings[0])
+		self.assertIn("property", rule_warnings[0])
 
 	def test_all_node_types_with_different_severities(self):
 		"""Test all supported node types with different severity configurations."""
@@ -6,13 +6,12 @@ Tests: fix_operations, path_translator, fix_engine, reference_finder,
 and NamePatternRule fix generation.
 """
 
+import copy
+import io
 import json
 import os
 import sys
 import unittest
-import tempfile
-from collections import OrderedDict
-from pathlib import Path
 
 # Add the src directory to the PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
@@ -21,43 +20,74 @@ from ignition_lint.common.fix_operations import Fix, FixOperation, FixOperationT
 from ignition_lint.common.path_translator import PathTranslator
 from ignition_lint.common.fix_engine import FixEngine, FixResult
 from ignition_lint.common.reference_finder import ComponentReferenceFinder
-from ignition_lint.common.flatten_json import flatten_json, read_json_file, write_json_file
-from ignition_lint.linter import LintEngine
-from ignition_lint.rules import RULES_MAP
+from ignition_lint.common.flatten_json import flatten_json, read_json_from_stream, write_json_to_stream
+
+
+def import_lint_engine():
+	"""
+	Import LintEngine and RULES_MAP on demand.
+
+	Loading the rules package pulls in every rule (and pylint), so only the
+	test classes that actually lint pay for it.
+	"""
+	from ignition_lint.linter import LintEngine  # pylint: disable=import-outside-toplevel
+	from ignition_lint.rules import RULES_MAP  # pylint: disable=import-outside-toplevel
+	return LintEngine, RULES_MAP
 
 
 def make_view_json(children, custom=None, params=None):
-	"""Helper to build a minimal view.json OrderedDict."""
-	view = OrderedDict()
+	"""Helper to build a minimal view.json dict."""
+	view = {}
 	if custom:
 		view['custom'] = custom
 	if params:
 		view['params'] = params
-	view['root'] = OrderedDict([
-		('children', children),
-		('meta', OrderedDict([('name', 'root')])),
-		('props', OrderedDict()),
-		('type', 'ia.container.flex'),
-	])
+	view['root'] = {
+		'children': children,
+		'meta': {'name': 'root'},
+		'props': {},
+		'type': 'ia.container.flex',
+	}
 	return view
 
 
+def build_fixture(json_data):
+	"""
+	Flatten and translate a view fixture once.
+
+	Returns a (json_data, flattened, translator) tuple. The translator holds a
+	reference to json_data, so tests that apply fixes must build their own
+	fixture from a deep copy rather than reuse a shared one.
+	"""
+	return json_data, flatten_json(json_data), PathTranslator(json_data)
+
+
 def make_component(name, comp_type='ia.display.label', children=None, props=None, propConfig=None):
-	"""Helper to build a component OrderedDict."""
-	comp = OrderedDict()
+	"""Helper to build a component dict."""
+	comp = {}
 	if children is not None:
 		comp['children'] = children
-	comp['meta'] = OrderedDict([('name', name)])
+	comp['meta'] = {'name': name}
 	if props:
 		comp['props'] = props
 	else:
-		comp['props'] = OrderedDict()
+		comp['props'] = {}
 	comp['type'] = comp_type
 	if propConfig:
 		comp['propConfig'] = propConfig
 	return comp
 
 
+# badButton plus a label whose expression references it. Shared by several tests;
+# anything that applies fixes must work on a deep copy.
+BAD_BUTTON_WITH_REF_TEMPLATE = make_view_json(
+	children=[
+		make_component('badButton', 'ia.input.button'),
+		make_component('MyLabel', 'ia.display.label', props={'text': '{../badButton.props.text}'}),
+	]
+)
+
+
 # =============================================================================
 # Test FixOperation and Fix data model
 # =============================================================================
@@ -214,7 +244,7 @@ class TestPathTranslator(unittest.TestCase):
 		json_data = make_view_json(
 			children=[
 				make_component(
-					'BadButton', 'ia.input.button', props=OrderedDict([('text', 'Click me')])
+					'BadButton', 'ia.input.button', props={'text': 'Click me'}
 				),
 			]
 		)
@@ -352,19 +382,24 @@ class TestFixEngine(unittest.TestCase):
 class TestReferenceFinder(unittest.TestCase):
 	"""Test ComponentReferenceFinder searching for component name references."""
 
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Build fixtures shared by several read-only tests."""
+		cls.button_with_label_ref = build_fixture(
+			make_view_json(
+				children=[
+					make_component('MyButton', 'ia.input.button'),
+					make_component(
+						'MyLabel', 'ia.display.label',
+						props={'text': '{../MyButton.props.text}'}
+					),
+				]
+			)
+		)
+
 	def test_find_expression_reference(self):
 		"""Should find component name in expression binding."""
-		json_data = make_view_json(
-			children=[
-				make_component('MyButton', 'ia.input.button'),
-				make_component(
-					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../MyButton.props.text}')])
-				),
-			]
-		)
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		_, flattened, translator = self.button_with_label_ref
 		finder = ComponentReferenceFinder(flattened, translator)
 
 		refs = finder.find_references('MyButton')
@@ -380,7 +415,7 @@ class TestReferenceFinder(unittest.TestCase):
 				make_component('Switch1', 'ia.input.switch'),
 				make_component(
 					'Label1', 'ia.display.label',
-					props=OrderedDict([('bindingRef', '../Switch1.props.selected')])
+					props={'bindingRef': '../Switch1.props.selected'}
 				),
 			]
 		)
@@ -399,7 +434,7 @@ class TestReferenceFinder(unittest.TestCase):
 				make_component('TargetButton', 'ia.input.button'),
 				make_component(
 					'ScriptComp', 'ia.display.label',
-					props=OrderedDict([('text', "self.getSibling('TargetButton').props.text")])
+					props={'text': "self.getSibling('TargetButton').props.text"}
 				),
 			]
 		)
@@ -431,20 +466,14 @@ class TestReferenceFinder(unittest.TestCase):
 		json_data = make_view_json(
 			children=[
 				make_component(
-					'MyButton', 'ia.input.button', propConfig=OrderedDict([(
-						'meta.tooltip.text',
-						OrderedDict([(
-							'binding',
-							OrderedDict([
-								(
-									'config',
-									OrderedDict([('expression',
-											'{this.meta.name}')])
-								),
-								('type', 'expr'),
-							])
-						)])
-					)])
+					'MyButton', 'ia.input.button', propConfig={
+						'meta.tooltip.text': {
+							'binding': {
+								'config': {'expression': '{this.meta.name}'},
+								'type': 'expr',
+							}
+						}
+					}
 				),
 			]
 		)
@@ -459,16 +488,14 @@ class TestReferenceFinder(unittest.TestCase):
 		json_data = make_view_json(
 			children=[
 				make_component(
-					'MyButton', 'ia.input.button', propConfig=OrderedDict([(
-						'props.text',
-						OrderedDict([(
-							'binding',
-							OrderedDict([
-								('config', OrderedDict([('path', 'this.meta.name')])),
-								('type', 'property'),
-							])
-						)])
-					)])
+					'MyButton', 'ia.input.button', propConfig={
+						'props.text': {
+							'binding': {
+								'config': {'path': 'this.meta.name'},
+								'type': 'property',
+							}
+						}
+					}
 				),
 			]
 		)
@@ -491,17 +518,7 @@ class TestReferenceFinder(unittest.TestCase):
 
 	def test_build_rename_operations(self):
 		"""build_rename_operations should create STRING_REPLACE operations."""
-		json_data = make_view_json(
-			children=[
-				make_component('MyButton', 'ia.input.button'),
-				make_component(
-					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../MyButton.props.text}')])
-				),
-			]
-		)
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		_, flattened, translator = self.button_with_label_ref
 		finder = ComponentReferenceFinder(flattened, translator)
 
 		refs = finder.find_references('MyButton')
@@ -513,29 +530,52 @@ class TestReferenceFinder(unittest.TestCase):
 		self.assertEqual(operations[0].new_substring, 'NewButton')
 
 
+class NamePatternFixTestCase(unittest.TestCase):
+	"""Base class for tests that lint with a shared NamePatternRule engine."""
+
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Load the linting engine and start an empty engine cache for the class."""
+		cls.lint_engine_class, cls.rules_map = import_lint_engine()
+		cls._engines = {}
+
+	def _create_engine_with_rule(self, convention='PascalCase'):
+		"""Get the class's LintEngine with a NamePatternRule for the given convention."""
+		engine = self._engines.get(convention)
+		if engine is None:
+			rule_class = self.rules_map['NamePatternRule']
+			rule = rule_class.create_from_config({
+				'convention': convention,
+				'target_node_types': ['component'],
+				'severity': 'warning',
+			})
+			engine = self._engines[convention] = self.lint_engine_class([rule])
+
+		# Errors, warnings and fixes reset on every process() call, but the fix context
+		# only changes when one is passed in, so clear what the previous test left behind.
+		for rule in engine.rules:
+			rule.set_fix_context(None, None)
+		return engine
+
+
 # =============================================================================
 # Test NamePatternRule fix generation
 # =============================================================================
-class TestNamePatternRuleFixes(unittest.TestCase):
+class TestNamePatternRuleFixes(NamePatternFixTestCase):
 	"""Test that NamePatternRule generates correct Fix objects."""
 
-	def _create_engine_with_rule(self, convention='PascalCase'):
-		"""Create a LintEngine with a NamePatternRule."""
-		rule_class = RULES_MAP['NamePatternRule']
-		rule = rule_class.create_from_config({
-			'convention': convention,
-			'target_node_types': ['component'],
-			'severity': 'warning',
-		})
-		return LintEngine([rule])
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Load the linting engine and build fixtures shared by read-only tests."""
+		super().setUpClass()
+		cls.bad_button = build_fixture(make_view_json(children=[
+			make_component('badButton', 'ia.input.button'),
+		]))
+		cls.bad_button_with_ref = build_fixture(BAD_BUTTON_WITH_REF_TEMPLATE)
 
 	def test_generates_safe_fix_for_unreferenced_component(self):
 		"""Should generate a safe fix when component has no references."""
-		json_data = make_view_json(children=[
-			make_component('badButton', 'ia.input.button'),
-		])
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		json_data, flattened, translator = self.bad_button
 		engine = self._create_engine_with_rule()
 
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
@@ -551,17 +591,7 @@ class TestNamePatternRuleFixes(unittest.TestCase):
 
 	def test_generates_unsafe_fix_for_referenced_component(self):
 		"""Should generate an unsafe fix when component has references."""
-		json_data = make_view_json(
-			children=[
-				make_component('badButton', 'ia.input.button'),
-				make_component(
-					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../badButton.props.text}')])
-				),
-			]
-		)
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		json_data, flattened, translator = self.bad_button_with_ref
 		engine = self._create_engine_with_rule()
 
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
@@ -590,10 +620,7 @@ class TestNamePatternRuleFixes(unittest.TestCase):
 
 	def test_no_fix_without_fix_context(self):
 		"""Should not generate fixes when fix context is not provided."""
-		json_data = make_view_json(children=[
-			make_component('badButton', 'ia.input.button'),
-		])
-		flattened = flatten_json(json_data)
+		_, flattened, _ = self.bad_button
 		engine = self._create_engine_with_rule()
 
 		# Process without json_data/path_translator
@@ -607,16 +634,14 @@ class TestNamePatternRuleFixes(unittest.TestCase):
 		json_data = make_view_json(
 			children=[
 				make_component(
-					'badButton', 'ia.input.button', propConfig=OrderedDict([(
-						'props.text',
-						OrderedDict([(
-							'binding',
-							OrderedDict([
-								('config', OrderedDict([('path', 'this.meta.name')])),
-								('type', 'property'),
-							])
-						)])
-					)])
+					'badButton', 'ia.input.button', propConfig={
+						'props.text': {
+							'binding': {
+								'config': {'path': 'this.meta.name'},
+								'type': 'property',
+							}
+						}
+					}
 				),
 			]
 		)
@@ -636,20 +661,18 @@ class TestNamePatternRuleFixes(unittest.TestCase):
 		json_data = make_view_json(
 			children=[
 				make_component(
-					'badButton', 'ia.input.button', propConfig=OrderedDict([(
-						'props.text',
-						OrderedDict([(
-							'binding',
-							OrderedDict([
-								('config', OrderedDict([('path', 'this.meta.name')])),
-								('type', 'property'),
-							])
-						)])
-					)])
+					'badButton', 'ia.input.button', propConfig={
+						'props.text': {
+							'binding': {
+								'config': {'path': 'this.meta.name'},
+								'type': 'property',
+							}
+						}
+					}
 				),
 				make_component(
 					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../badButton.props.enabled}')])
+					props={'text': '{../badButton.props.enabled}'}
 				),
 			]
 		)
@@ -682,7 +705,7 @@ class TestNamePatternRuleFixes(unittest.TestCase):
 # =============================================================================
 # Test end-to-end fix application
 # =============================================================================
-class TestEndToEndFixApplication(unittest.TestCase):
+class TestEndToEndFixApplication(NamePatternFixTestCase):
 	"""Integration test: detect violation -> generate fix -> apply fix -> verify JSON."""
 
 	def test_full_safe_rename_pipeline(self):
@@ -696,14 +719,8 @@ class TestEndToEndFixApplication(unittest.TestCase):
 		translator = PathTranslator(json_data)
 		flattened = flatten_json(json_data)
 
-		# Create engine and process
-		rule_class = RULES_MAP['NamePatternRule']
-		rule = rule_class.create_from_config({
-			'convention': 'PascalCase',
-			'target_node_types': ['component'],
-			'severity': 'warning',
-		})
-		engine = LintEngine([rule])
+		# Get engine and process
+		engine = self._create_engine_with_rule()
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
 
 		# Apply fixes
@@ -718,26 +735,11 @@ class TestEndToEndFixApplication(unittest.TestCase):
 
 	def test_full_unsafe_rename_with_references(self):
 		"""Full pipeline: lint -> fix -> apply (unsafe) -> verify references updated."""
-		json_data = make_view_json(
-			children=[
-				make_component('badButton', 'ia.input.button'),
-				make_component(
-					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../badButton.props.text}')])
-				),
-			]
-		)
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		# Fixes are applied in place, so work on a private copy of the template
+		json_data, flattened, translator = build_fixture(copy.deepcopy(BAD_BUTTON_WITH_REF_TEMPLATE))
 
-		# Create engine and process
-		rule_class = RULES_MAP['NamePatternRule']
-		rule = rule_class.create_from_config({
-			'convention': 'PascalCase',
-			'target_node_types': ['component'],
-			'severity': 'warning',
-		})
-		engine = LintEngine([rule])
+		# Get engine and process
+		engine = self._create_engine_with_rule()
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
 
 		# Apply fixes with unsafe allowed
@@ -752,59 +754,34 @@ class TestEndToEndFixApplication(unittest.TestCase):
 		self.assertNotIn('badButton', json_data['root']['children'][1]['props']['text'])
 
 	def test_write_and_read_back(self):
-		"""Applied fixes should survive write_json_file + read_json_file round-trip."""
+		"""Applied fixes should survive a JSON write + read round-trip."""
 		json_data = make_view_json(children=[
 			make_component('badButton', 'ia.input.button'),
 		])
 		translator = PathTranslator(json_data)
 		flattened = flatten_json(json_data)
 
-		# Create engine and process
-		rule_class = RULES_MAP['NamePatternRule']
-		rule = rule_class.create_from_config({
-			'convention': 'PascalCase',
-			'target_node_types': ['component'],
-			'severity': 'warning',
-		})
-		engine = LintEngine([rule])
+		# Get engine and process
+		engine = self._create_engine_with_rule()
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
 
 		# Apply fixes
 		fix_engine = FixEngine(translator)
 		fix_engine.apply_fixes(results.fixes, safe_only=True)
 
-		# Write to temp file and read back
-		with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-			temp_path = Path(f.name)
-
-		try:
-			write_json_file(temp_path, json_data)
-			read_back = read_json_file(temp_path)
-			self.assertEqual(read_back['root']['children'][0]['meta']['name'], 'BadButton')
-		finally:
-			temp_path.unlink(missing_ok=True)
+		# Write to an in-memory stream and read back (file I/O is covered in test_flatten_json)
+		buffer = io.StringIO()
+		write_json_to_stream(buffer, json_data)
+		buffer.seek(0)
+		read_back = read_json_from_stream(buffer)
+		self.assertEqual(read_back['root']['children'][0]['meta']['name'], 'BadButton')
 
 	def test_safe_only_skips_unsafe_fixes(self):
 		"""When safe_only=True, unsafe fixes should be skipped."""
-		json_data = make_view_json(
-			children=[
-				make_component('badButton', 'ia.input.button'),
-				make_component(
-					'MyLabel', 'ia.display.label',
-					props=OrderedDict([('text', '{../badButton.props.text}')])
-				),
-			]
-		)
-		translator = PathTranslator(json_data)
-		flattened = flatten_json(json_data)
+		# Fixes are applied in place, so work on a private copy of the template
+		json_data, flattened, translator = build_fixture(copy.deepcopy(BAD_BUTTON_WITH_REF_TEMPLATE))
 
-		rule_class = RULES_MAP['NamePatternRule']
-		rule = rule_class.create_from_config({
-			'convention': 'PascalCase',
-			'target_node_types': ['component'],
-			'severity': 'warning',
-		})
-		engine = LintEngine([rule])
+		engine = self._create_engine_with_rule()
 		results = engine.process(flattened, json_data=json_data, path_translator=translator)
 
 		# Apply with safe_only=True
@@ -6,6 +6,7 @@ Tests the JSON flattening functionality that converts hierarchical JSON
 structures into flat path-value pairs for linting processing.
 """
 
+import io
 import json
 import os
 import shutil
@@ -19,8 +20,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
 from ignition_lint.common.flatten_json import (
-	flatten_json, flatten_file, read_json_file, write_json_file, format_json, preserve_unicode_escapes,
-	restore_unicode_escapes
+	flatten_json, flatten_dict, flatten_file, read_json_file, write_json_file, read_json_from_stream,
+	write_json_to_stream, format_json, preserve_unicode_escapes, restore_unicode_escapes
 )
 
 
@@ -210,6 +211,20 @@ class TestFileOperations(unittest.TestCase):
 
 		self.assertEqual(result, test_data)
 
+	def test_stream_round_trip(self):
+		"""Test writing to and reading back from a text stream."""
+		test_data = {"name": "test", "nested": {"text": "<it's>"}}
+		buffer = io.StringIO()
+
+		write_json_to_stream(buffer, test_data)
+		self.assertIn("\\u003c", buffer.getvalue())
+
+		buffer.seek(0)
+		result = read_json_from_stream(buffer)
+
+		self.assertIsInstance(result, OrderedDict)
+		self.assertEqual(result, test_data)
+
 	def test_flatten_file(self):
 		"""Test the flatten_file convenience function."""
 		test_data = {"component": {"name": "TestButton", "props": {"text": "Click"}}}
@@ -224,6 +239,20 @@ class TestFileOperations(unittest.TestCase):
 		self.assertIn("component.name", result)
 		self.assertEqual(result["component.name"], "TestButton")
 
+	def test_flatten_dict_matches_flatten_file(self):
+		"""Test that flatten_dict on parsed data matches flatten_file on the same JSON."""
+		test_data = {
+			"root": {"meta": {"name": "root"}, "children": [{"meta": {"name": "Label"}}]},
+			"custom": {"b": 1, "a": 2}
+		}
+		test_file = self.temp_dir / "view.json"
+		test_file.write_text(json.dumps(test_data), encoding="utf-8")
+
+		result = flatten_dict(test_data)
+
+		self.assertIsInstance(result, OrderedDict)
+		self.assertEqual(list(result.items()), list(flatten_file(test_file).items()))
+
 	def test_format_json(self):
 		"""Test JSON formatting."""
 		data = {"name": "test", "nested": {"value": 123}}
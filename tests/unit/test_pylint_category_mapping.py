@@ -10,67 +10,123 @@ Tests cover:
 - Backward compatibility
 """
 
+import copy
+import re
 import unittest
-from unittest.mock import patch
-from io import StringIO
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from src.ignition_lint.rules.scripts.lint_script import PylintScriptRule, PylintViolation
+from src.ignition_lint.rules.scripts.lint_script import (
+	PylintScriptRule, PylintViolation, split_pylint_output_line
+)
+
+
+# Mappings passed to the PylintScriptRule constructor; the template rules are cached per mapping
+STRICT_CATEGORY_MAPPING = {
+	'F': 'error',
+	'E': 'error',
+	'W': 'error',
+	'C': 'error',
+	'R': 'error',
+}
+LENIENT_CATEGORY_MAPPING = {
+	'F': 'error',
+	'E': 'error',
+	'W': 'warning',
+	'C': 'warning',
+	'R': 'warning',
+}
+
+
+def find_missing_substrings(text, needles):
+	"""
+	Return the needles that do not occur in text, scanning it once.
+
+	Needles must not overlap each other in the text, since the alternation only reports non-overlapping matches.
+
+	Args:
+		text: Text to search
+		needles: Substrings expected in the text
+
+	Returns:
+		Set of needles that were not found
+	"""
+	pattern = re.compile('|'.join(map(re.escape, needles)))
+	return set(needles) - set(pattern.findall(text))
 
 
 class TestPylintCategoryMapping(unittest.TestCase):
 	"""Test suite for PylintScriptRule category mapping."""
 
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Build template rules once; __init__ searches the filesystem for a pylintrc."""
+		cls.template_rule = PylintScriptRule()
+		cls.mapped_rules = {}
+		cls.get_mapped_rule(STRICT_CATEGORY_MAPPING)
+		cls.get_mapped_rule(LENIENT_CATEGORY_MAPPING)
+
+	@classmethod
+	def get_mapped_rule(cls, category_mapping):
+		"""Return the template rule constructed with a category mapping, building it on first use."""
+		key = frozenset(category_mapping.items())
+		if key not in cls.mapped_rules:
+			cls.mapped_rules[key] = PylintScriptRule(category_mapping=dict(category_mapping))
+		return cls.mapped_rules[key]
+
+	def _make_rule(self, category_mapping=None):
+		"""Return a fresh copy of a template rule, optionally constructed with a custom category mapping."""
+		if category_mapping is None:
+			return copy.deepcopy(self.template_rule)
+		return copy.deepcopy(self.get_mapped_rule(category_mapping))
+
 	def test_default_category_mapping(self):
 		"""Test that default category mapping is F/E → error, W/C/R → warning."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 
 		# Verify default mapping
-		self.assertEqual(rule.category_mapping['F'], 'error')
-		self.assertEqual(rule.category_mapping['E'], 'error')
-		self.assertEqual(rule.category_mapping['W'], 'warning')
-		self.assertEqual(rule.category_mapping['C'], 'warning')
-		self.assertEqual(rule.category_mapping['R'], 'warning')
+		self.assertDictEqual(
+			rule.category_mapping, {
+				'F': 'error',
+				'E': 'error',
+				'W': 'warning',
+				'C': 'warning',
+				'R': 'warning',
+			}
+		)
 
 	def test_custom_category_mapping_strict(self):
 		"""Test strict mode where all categories map to error."""
-		custom_mapping = {
-			'F': 'error',
-			'E': 'error',
-			'W': 'error',
-			'C': 'error',
-			'R': 'error',
-		}
-		rule = PylintScriptRule(category_mapping=custom_mapping)
+		rule = self._make_rule(category_mapping=STRICT_CATEGORY_MAPPING)
 
 		# Verify custom mapping
-		self.assertEqual(rule.category_mapping['F'], 'error')
-		self.assertEqual(rule.category_mapping['E'], 'error')
-		self.assertEqual(rule.category_mapping['W'], 'error')
-		self.assertEqual(rule.category_mapping['C'], 'error')
-		self.assertEqual(rule.category_mapping['R'], 'error')
+		self.assertDictEqual(
+			rule.category_mapping, {
+				'F': 'error',
+				'E': 'error',
+				'W': 'error',
+				'C': 'error',
+				'R': 'error',
+			}
+		)
 
 	def test_custom_category_mapping_lenient(self):
 		"""Test lenient mode where only F/E are errors."""
-		custom_mapping = {
-			'F': 'error',
-			'E': 'error',
-			'W': 'warning',
-			'C': 'warning',
-			'R': 'warning',
-		}
-		rule = PylintScriptRule(category_mapping=custom_mapping)
+		rule = self._make_rule(category_mapping=LENIENT_CATEGORY_MAPPING)
 
 		# Verify custom mapping
-		self.assertEqual(rule.category_mapping['F'], 'error')
-		self.assertEqual(rule.category_mapping['E'], 'error')
-		self.assertEqual(rule.category_mapping['W'], 'warning')
-		self.assertEqual(rule.category_mapping['C'], 'warning')
-		self.assertEqual(rule.category_mapping['R'], 'warning')
+		self.assertDictEqual(
+			rule.category_mapping, {
+				'F': 'error',
+				'E': 'error',
+				'W': 'warning',
+				'C': 'warning',
+				'R': 'warning',
+			}
+		)
 
 	def test_pylint_violation_dataclass(self):
 		"""Test that PylintViolation dataclass stores all required fields."""
@@ -87,7 +143,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_structured_violation_storage(self):
 		"""Test that violations are stored in structured format."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 
 		# Create test violations
 		violation1 = PylintViolation(
@@ -106,7 +162,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_get_category_grouped_violations_empty(self):
 		"""Test category grouping with no violations."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = []
 
 		grouped = rule.get_category_grouped_violations()
@@ -115,7 +171,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_get_category_grouped_violations_single_category(self):
 		"""Test category grouping with violations from one category."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = [
 			PylintViolation(
 				category='E', code='E0602', message="Undefined variable 'x'", path='script1', line=5
@@ -133,7 +189,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_get_category_grouped_violations_multiple_categories(self):
 		"""Test category grouping with violations from multiple categories."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = [
 			PylintViolation(category='F', code='F0401', message="Cannot import", path='s1', line=1),
 			PylintViolation(category='E', code='E0602', message="Undefined", path='s2', line=2),
@@ -164,7 +220,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 			'C': 'warning',
 			'R': 'warning',
 		}
-		rule = PylintScriptRule(category_mapping=custom_mapping)
+		rule = self._make_rule(category_mapping=custom_mapping)
 		rule.pylint_violations = [
 			PylintViolation(category='W', code='W0611', message="Unused import", path='s1', line=1),
 		]
@@ -176,7 +232,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_get_category_grouped_violations_formatting(self):
 		"""Test that grouped violations format messages correctly."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = [
 			PylintViolation(
 				category='E', code='E0602', message="Undefined variable 'x'",
@@ -195,7 +251,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_category_order_in_grouped_output(self):
 		"""Test that categories are ordered F, E, W, C, R in grouped output."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		# Add violations in random order
 		rule.pylint_violations = [
 			PylintViolation(category='R', code='R0913', message="msg", path='s', line=1),
@@ -248,7 +304,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_backward_compatibility_errors_warnings_lists(self):
 		"""Test that errors and warnings lists still work for backward compatibility."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 
 		# Manually add violations with different severities
 		rule.add_violation("Error message", severity="error")
@@ -276,7 +332,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_multiple_violations_same_category(self):
 		"""Test multiple violations in same category are grouped together."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = [
 			PylintViolation(category='E', code='E0602', message="Undefined 'x'", path='s1', line=1),
 			PylintViolation(category='E', code='E1101', message="No member", path='s2', line=2),
@@ -290,7 +346,7 @@ class TestPylintCategoryMapping(unittest.TestCase):
 
 	def test_category_names_mapping(self):
 		"""Test that category codes map to correct human-readable names."""
-		rule = PylintScriptRule()
+		rule = self._make_rule()
 		rule.pylint_violations = [
 			PylintViolation(category='F', code='F0001', message="msg", path='s', line=1),
 			PylintViolation(category='E', code='E0001', message="msg", path='s', line=1),
@@ -337,8 +393,38 @@ test.py:1:0: C0114: Missing module docstring (missing-module-docstring)"""
 		self.assertEqual(rule.pylint_violations[2].category, 'C')
 		self.assertEqual(rule.pylint_violations[2].code, 'C0114')
 
-	@patch('sys.stdout', new_callable=StringIO)
-	def test_print_category_grouped_output(self, mock_stdout):
+	def test_split_pylint_output_line(self):
+		"""Test that pylint output lines split into line, code and message, including unusual paths."""
+		self.assertEqual(
+			split_pylint_output_line("test.py:5:10: E0602: Undefined variable 'x' (undefined-variable)"),
+			(5, 'E0602', "Undefined variable 'x' (undefined-variable)")
+		)
+		# Colons inside the message are kept
+		self.assertEqual(
+			split_pylint_output_line("test.py:1:0: E0001: Parsing failed: 'bad' (syntax-error)"),
+			(1, 'E0001', "Parsing failed: 'bad' (syntax-error)")
+		)
+		# A path containing ': ' still splits on the location prefix
+		self.assertEqual(
+			split_pylint_output_line("odd: dir/test.py:7:1: W0611: Unused import os (unused-import)"),
+			(7, 'W0611', "Unused import os (unused-import)")
+		)
+		# The last ':line:col: CODE: ' prefix wins when an earlier one also looks well-formed
+		self.assertEqual(
+			split_pylint_output_line(":12:0: W0611: E06021/.x: :12:0: W0611: a"),
+			(12, 'W0611', 'a')
+		)
+		# Parsing stops at an embedded newline, so a prefix split across lines is not a message
+		self.assertIsNone(split_pylint_output_line("test.py\n:3:0: E0602: x"))
+		self.assertEqual(split_pylint_output_line("test.py:3:0: E0602: x\nsecond"), (3, 'E0602', 'x'))
+		# Superscript digits are not decimal digits, and the message can't be empty
+		self.assertIsNone(split_pylint_output_line("test.py:\u00b2:0: E0602: x"))
+		self.assertIsNone(split_pylint_output_line("test.py:3:0: E0602: "))
+		# Non-message lines are skipped
+		self.assertIsNone(split_pylint_output_line("************* Module test"))
+		self.assertIsNone(split_pylint_output_line("Your code has been rated at 5.00/10"))
+
+	def test_print_category_grouped_output(self):
 		"""Test that category-grouped output prints correctly using format_violations_grouped."""
 		# Create rule with violations
 		rule = PylintScriptRule()
@@ -362,18 +448,16 @@ test.py:1:0: C0114: Missing module docstring (missing-module-docstring)"""
 		self.assertIn('errors', output)
 		self.assertIn('warnings', output)
 
-		# Check error output
-		self.assertIn("Pylint - Error (E)", output['errors'])
-		self.assertIn("E0602", output['errors'])
-		self.assertIn("root.Button.script", output['errors'])
-
-		# Check warning output
-		self.assertIn("Pylint - Warning (W)", output['warnings'])
-		self.assertIn("W0611", output['warnings'])
-		self.assertIn("root.Label.transform", output['warnings'])
+		# Check error and warning output, one scan each
+		self.assertEqual(
+			find_missing_substrings(output['errors'], ("Pylint - Error (E)", "E0602", "root.Button.script")), set()
+		)
+		self.assertEqual(
+			find_missing_substrings(output['warnings'], ("Pylint - Warning (W)", "W0611", "root.Label.transform")),
+			set()
+		)
 
-	@patch('sys.stdout', new_callable=StringIO)
-	def test_print_category_grouped_output_severity_icons(self, mock_stdout):
+	def test_print_category_grouped_output_severity_icons(self):
 		"""Test that correct category labels are used in output."""
 		# Create rule with error and warning
 		rule = PylintScriptRule()
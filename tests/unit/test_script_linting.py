@@ -4,24 +4,147 @@ Unit tests for the PylintScriptRule.
 Tests script linting functionality.
 """
 
+import functools
+import itertools
+import json
+import re
 import unittest
-from typing import Dict, Any
+from pathlib import Path
+from typing import Any, Dict, Tuple
 
 from fixtures.base_test import BaseRuleTest
-from fixtures.test_helpers import get_test_config, load_test_view
+from fixtures.test_helpers import flatten_test_view, get_test_config, get_test_view_path, load_test_view
+# fixtures.base_test puts src/ on sys.path
+from ignition_lint.model.node_types import TransformScript
+
+# Built once; run_lint_on_file only reads the config, so tests can share it
+PYLINT_RULE_CONFIG = get_test_config("PylintScriptRule")
+
+
+# Indentation checks for formatted script lines; assertRegex only builds its message on failure
+TAB_COMMENT = re.compile(r'^\t#')
+TAB_DATASET = re.compile(r'^\tdataset')
+SINGLE_TAB = re.compile(r'^[^\t]*\t[^\t]*$')
+NESTED_IF = re.compile(r'^\t    if|^[^\t]*\t[^\t]*$')
+
+
+# Minimal view whose only script is a tag binding transform; the code placeholder is spliced per test
+TRANSFORM_SCRIPT_CODE_PLACEHOLDER = "__TRANSFORM_SCRIPT_CODE__"
+TRANSFORM_SCRIPT_VIEW_TEMPLATE = json.dumps({
+	"custom": {},
+	"params": {},
+	"propConfig": {
+		"custom.testProp": {
+			"binding": {
+				"type": "tag",
+				"config": {
+					"tagPath": "[default]TestTag"
+				},
+				"transforms": [{
+					"type": "script",
+					"code": TRANSFORM_SCRIPT_CODE_PLACEHOLDER
+				}]
+			}
+		}
+	},
+	"props": {},
+	"root": {
+		"meta": {
+			"name": "root"
+		},
+		"type": "ia.container.flex"
+	}
+})
+
+
+def build_transform_script_view(code: str) -> str:
+	"""
+	Build the JSON text of a minimal view whose only script is a tag binding transform.
+
+	Args:
+		code: Source of the transform script
+
+	Returns:
+		View JSON content ready for run_lint_on_mock_view
+	"""
+	return TRANSFORM_SCRIPT_VIEW_TEMPLATE.replace(json.dumps(TRANSFORM_SCRIPT_CODE_PLACEHOLDER), json.dumps(code), 1)
+
+
+def find_formatted_lines(formatted: str) -> Dict[str, str | None]:
+	"""
+	Locate the first comment, code and nested code lines of a formatted script in one pass.
+
+	Args:
+		formatted: Output of get_formatted_script, including the function definition line
+
+	Returns:
+		Dict with 'comment', 'code' and 'nested' keys, each None if no matching line was found
+	"""
+	found: Dict[str, str | None] = {'comment': None, 'code': None, 'nested': None}
+	# Skip the function definition line without copying the rest of the list
+	for line in itertools.islice(formatted.splitlines(), 1, None):
+		if found['comment'] is None and line.lstrip().startswith('#'):
+			found['comment'] = line
+		if found['code'] is None and 'dataset = value' in line:
+			found['code'] = line
+		if found['nested'] is None and 'if dataset[row][0]' in line:
+			found['nested'] = line
+		if None not in found.values():
+			break
+	return found
+
+
+@functools.lru_cache(maxsize=None)
+def format_transform_script(script_content: str) -> Tuple[str, Dict[str, str | None]]:
+	"""
+	Format a script as a TransformScript body and index its interesting lines.
+
+	Args:
+		script_content: Raw transform script source
+
+	Returns:
+		Tuple of the formatted script and the find_formatted_lines result; treat both as read-only
+	"""
+	formatted = TransformScript(path="test.path", script=script_content).get_formatted_script()
+	return formatted, find_formatted_lines(formatted)
 
 
 class TestPylintScriptRule(BaseRuleTest):
 	"""Test script linting with pylint."""
 	rule_config: Dict[str, Dict[str, Any]]  # Override base class to make non-optional
 
+	# Case views used by these tests, resolved and parsed once per class
+	CASE_NAMES = ("PascalCase", "camelCase", "ExpressionBindings")
+	case_views: Dict[str, Path | None]
+
+	@classmethod
+	def setUpClass(cls):  # pylint: disable=invalid-name
+		"""Resolve and pre-parse each case view once; a missing case maps to None."""
+		super().setUpClass()
+		test_cases_dir = Path(__file__).parent.parent / "cases"
+		cls.case_views = {}
+		for case in cls.CASE_NAMES:
+			if not get_test_view_path(test_cases_dir, case).is_file():
+				cls.case_views[case] = None
+				continue
+			view_file = load_test_view(test_cases_dir, case)
+			flatten_test_view(view_file)
+			cls.case_views[case] = view_file
+
 	def setUp(self):  # pylint: disable=invalid-name
 		super().setUp()
-		self.rule_config = get_test_config("PylintScriptRule")
+		self.rule_config = PYLINT_RULE_CONFIG
+
+	def get_case_view(self, case: str) -> Path:
+		"""Return the pre-loaded view for a case, skipping the test if it is missing."""
+		view_file = self.case_views[case]
+		if view_file is None:
+			self.skipTest(f"Test case {case} not found")
+		return view_file
 
 	def test_basic_script_linting(self):
 		"""Test basic script linting functionality."""
-		view_file = load_test_view(self.test_cases_dir, "PascalCase")
+		view_file = self.get_case_view("PascalCase")
 		self.run_lint_on_file(view_file, self.rule_config)
 
 		# Just verify the rule runs without crashing
@@ -30,22 +153,13 @@ class TestPylintScriptRule(BaseRuleTest):
 
 	def test_multiple_view_files(self):
 		"""Test script linting on multiple view files."""
-		test_cases = ["PascalCase", "camelCase", "ExpressionBindings"]
-
-		for case in test_cases:
+		for case in self.CASE_NAMES:
 			with self.subTest(case=case):
-				try:
-					view_file = load_test_view(self.test_cases_dir, case)
-					self.run_lint_on_file(view_file, self.rule_config)
-					script_errors = self.get_errors_for_rule("PylintScriptRule")
-					self.assertIsInstance(script_errors, list)
-				except FileNotFoundError:
-					self.skipTest(f"Test case {case} not found")
+				self.run_lint_on_file(self.get_case_view(case), self.rule_config)
+				self.assertIsInstance(self.get_errors_for_rule("PylintScriptRule"), list)
 
 	def test_script_with_commented_first_line(self):
 		"""Test that scripts with commented first lines are indented correctly."""
-		from ignition_lint.model.node_types import TransformScript
-
 		# Script with comment as first line (NOT indented - this is the problematic case)
 		# The comment and code both have no leading tabs/spaces
 		script_content = """#    datasetPath = '[default]DeviceNames'
@@ -58,49 +172,32 @@ for row in range(dataset.rowCount):
 
 #    return value"""
 
-		# Create a TransformScript node
-		script_node = TransformScript(path="test.path", script=script_content)
-
-		# Get formatted script
-		formatted = script_node.get_formatted_script()
+		# Format as a TransformScript and find the first comment, code and nested lines
+		formatted, found = format_transform_script(script_content)
 
 		# Verify the function definition is present
 		self.assertIn("def transform(self, value):", formatted)
 
-		# Split into lines and check indentation
-		lines = formatted.split('\n')
-
-		# Find the first comment line (after function def)
-		comment_line = next((line for line in lines[1:] if line.strip().startswith('#')), None)
+		# First comment line after the function def
+		comment_line = found['comment']
 		self.assertIsNotNone(comment_line, "Comment line should be present")
 
 		# Comment should be indented with exactly one tab (not double-tabbed)
-		self.assertTrue(
-			comment_line.startswith('\t#'),
-			f"Comment should be indented with one tab, got: {repr(comment_line)}"
-		)
+		self.assertRegex(comment_line, TAB_COMMENT, "Comment should be indented with one tab")
 
 		# Verify subsequent code line is also properly indented (and not double-indented)
-		code_line = next((line for line in lines if 'dataset = value' in line), None)
+		code_line = found['code']
 		self.assertIsNotNone(code_line, "Code line should be present")
-		self.assertTrue(
-			code_line.startswith('\tdataset'),
-			f"Code line should be indented with one tab, got: {repr(code_line)}"
-		)
+		self.assertRegex(code_line, TAB_DATASET, "Code line should be indented with one tab")
 
 		# Verify nested code maintains relative indentation
-		nested_line = next((line for line in lines if 'if dataset[row][0]' in line), None)
+		nested_line = found['nested']
 		self.assertIsNotNone(nested_line, "Nested code line should be present")
 		# Should have base tab + 4 spaces for nested indentation
-		self.assertTrue(
-			nested_line.startswith('\t    if') or nested_line.count('\t') == 1,
-			f"Nested code should maintain relative indentation, got: {repr(nested_line)}"
-		)
+		self.assertRegex(nested_line, NESTED_IF, "Nested code should maintain relative indentation")
 
 	def test_script_already_indented_with_comment_first(self):
 		"""Test that already-indented scripts with commented first lines are preserved."""
-		from ignition_lint.model.node_types import TransformScript
-
 		# Script with comment as first line (already properly indented with tabs)
 		script_content = """\t#    datasetPath = '[default]DeviceNames'
 \tdataset = value
@@ -112,38 +209,26 @@ for row in range(dataset.rowCount):
 
 \t#    return value"""
 
-		# Create a TransformScript node
-		script_node = TransformScript(path="test.path", script=script_content)
-
-		# Get formatted script
-		formatted = script_node.get_formatted_script()
+		# Format as a TransformScript and find the first comment, code and nested lines
+		formatted, found = format_transform_script(script_content)
 
 		# Verify the function definition is present
 		self.assertIn("def transform(self, value):", formatted)
 
-		# Split into lines and check indentation
-		lines = formatted.split('\n')
-
-		# Find the first comment line (after function def)
-		comment_line = next((line for line in lines[1:] if line.strip().startswith('#')), None)
+		# First comment line after the function def
+		comment_line = found['comment']
 		self.assertIsNotNone(comment_line, "Comment line should be present")
 
 		# Comment should still be indented with one tab (not double-tabbed)
-		self.assertEqual(
-			comment_line.count('\t'), 1, f"Comment should have exactly one tab, got: {repr(comment_line)}"
-		)
+		self.assertRegex(comment_line, SINGLE_TAB, "Comment should have exactly one tab")
 
 		# Verify subsequent code line also has correct indentation
-		code_line = next((line for line in lines if 'dataset = value' in line), None)
+		code_line = found['code']
 		self.assertIsNotNone(code_line, "Code line should be present")
-		self.assertEqual(
-			code_line.count('\t'), 1, f"Code line should have exactly one tab, got: {repr(code_line)}"
-		)
+		self.assertRegex(code_line, SINGLE_TAB, "Code line should have exactly one tab")
 
 	def test_script_with_blank_lines_and_comments(self):
 		"""Test that scripts with blank lines followed by comments are handled correctly."""
-		from ignition_lint.model.node_types import TransformScript
-
 		# Script with blank line, then comment, then blank line, then comment, then code
 		# This tests that the logic traverses multiple iterations to find the first real code line
 		script_content = """
@@ -158,155 +243,67 @@ for row in range(dataset.rowCount):
     if dataset[row][0] == self.view.params.row:
         return dataset[row][1]"""
 
-		# Create a TransformScript node
-		script_node = TransformScript(path="test.path", script=script_content)
-
-		# Get formatted script
-		formatted = script_node.get_formatted_script()
+		# Format as a TransformScript and find the first comment, code and nested lines
+		formatted, found = format_transform_script(script_content)
 
 		# Verify the function definition is present
 		self.assertIn("def transform(self, value):", formatted)
 
-		# Split into lines and check indentation
-		lines = formatted.split('\n')
-
-		# Find the first comment line (after function def)
-		comment_line = next((line for line in lines[1:] if line.strip().startswith('#')), None)
+		# First comment line after the function def
+		comment_line = found['comment']
 		self.assertIsNotNone(comment_line, "Comment line should be present")
 
 		# Comment should be indented with exactly one tab
-		self.assertTrue(
-			comment_line.startswith('\t#'),
-			f"Comment should be indented with one tab, got: {repr(comment_line)}"
-		)
+		self.assertRegex(comment_line, TAB_COMMENT, "Comment should be indented with one tab")
 
 		# Verify code line is properly indented (not double-indented)
-		code_line = next((line for line in lines if 'dataset = value' in line), None)
+		code_line = found['code']
 		self.assertIsNotNone(code_line, "Code line should be present")
-		self.assertTrue(
-			code_line.startswith('\tdataset'),
-			f"Code line should be indented with one tab, got: {repr(code_line)}"
-		)
+		self.assertRegex(code_line, TAB_DATASET, "Code line should be indented with one tab")
 
 	def test_script_with_mixed_tabs_and_spaces(self):
 		"""Test that scripts mixing tabs and spaces are detected with clear error message."""
-		# Create a test view with a script that mixes tabs and spaces
-		view_content = {
-			"custom": {},
-			"params": {},
-			"propConfig": {
-				"custom.testProp": {
-					"binding": {
-						"type": "tag",
-						"config": {
-							"tagPath": "[default]TestTag"
-						},
-						"transforms": [{
-							"type": "script",
-							# Script with mixed tabs and spaces: base tab + spaces for nested indentation
-							"code":
-								"\tdataset = value\n\t    if True:\n\t        return dataset"
-						}]
-					}
-				}
-			},
-			"props": {},
-			"root": {
-				"meta": {
-					"name": "root"
-				},
-				"type": "ia.container.flex"
-			}
-		}
+		# Script with mixed tabs and spaces: base tab + spaces for nested indentation
+		view_content = build_transform_script_view("\tdataset = value\n\t    if True:\n\t        return dataset")
+
+		# Run linting
+		self.run_lint_on_mock_view(view_content, self.rule_config)
+		errors = self.get_errors_for_rule("PylintScriptRule")
 
-		import json
-		import tempfile
-		from pathlib import Path
-		view_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-		json.dump(view_content, view_file)
-		view_file.close()
-
-		try:
-			# Run linting
-			self.run_lint_on_file(Path(view_file.name), self.rule_config)
-			errors = self.get_errors_for_rule("PylintScriptRule")
-
-			# Should have at least one error
-			self.assertGreater(len(errors), 0, "Expected errors for mixed tabs/spaces")
-
-			# Check that the explicit mixed tabs/spaces error is present
-			mixed_tabs_error_found = any(
-				"mixes tabs and spaces for indentation" in error for error in errors
-			)
-			self.assertTrue(
-				mixed_tabs_error_found, f"Expected 'mixes tabs and spaces' error message. Got: {errors}"
-			)
-
-			# Verify the error message is clear and actionable
-			mixed_error = next((error for error in errors if "mixes tabs and spaces" in error), None)
-			self.assertIn(
-				"Use either tabs OR spaces consistently", mixed_error,
-				"Error message should provide clear guidance"
-			)
-
-		finally:
-			import os
-			os.unlink(view_file.name)
+		# Should have at least one error
+		self.assertGreater(len(errors), 0, "Expected errors for mixed tabs/spaces")
+
+		# Check that the explicit mixed tabs/spaces error is present
+		mixed_tabs_error_found = any(
+			"mixes tabs and spaces for indentation" in error for error in errors
+		)
+		self.assertTrue(
+			mixed_tabs_error_found, f"Expected 'mixes tabs and spaces' error message. Got: {errors}"
+		)
+
+		# Verify the error message is clear and actionable
+		mixed_error = next((error for error in errors if "mixes tabs and spaces" in error), None)
+		self.assertIn(
+			"Use either tabs OR spaces consistently", mixed_error,
+			"Error message should provide clear guidance"
+		)
 
 	def test_script_with_only_tabs(self):
 		"""Test that scripts using only tabs don't trigger mixed indentation error."""
-		# Create a test view with a script that uses only tabs
-		view_content = {
-			"custom": {},
-			"params": {},
-			"propConfig": {
-				"custom.testProp": {
-					"binding": {
-						"type": "tag",
-						"config": {
-							"tagPath": "[default]TestTag"
-						},
-						"transforms": [{
-							"type": "script",
-							# Script with only tabs
-							"code": "\tdataset = value\n\tif True:\n\t\treturn dataset"
-						}]
-					}
-				}
-			},
-			"props": {},
-			"root": {
-				"meta": {
-					"name": "root"
-				},
-				"type": "ia.container.flex"
-			}
-		}
+		view_content = build_transform_script_view("\tdataset = value\n\tif True:\n\t\treturn dataset")
+
+		# Run linting
+		self.run_lint_on_mock_view(view_content, self.rule_config)
+		errors = self.get_errors_for_rule("PylintScriptRule")
 
-		import json
-		import tempfile
-		from pathlib import Path
-		view_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-		json.dump(view_content, view_file)
-		view_file.close()
-
-		try:
-			# Run linting
-			self.run_lint_on_file(Path(view_file.name), self.rule_config)
-			errors = self.get_errors_for_rule("PylintScriptRule")
-
-			# Should NOT have mixed tabs/spaces error
-			mixed_tabs_error_found = any(
-				"mixes tabs and spaces for indentation" in error for error in errors
-			)
-			self.assertFalse(
-				mixed_tabs_error_found,
-				f"Should not report mixed indentation for tabs-only script. Got: {errors}"
-			)
-
-		finally:
-			import os
-			os.unlink(view_file.name)
+		# Should NOT have mixed tabs/spaces error
+		mixed_tabs_error_found = any(
+			"mixes tabs and spaces for indentation" in error for error in errors
+		)
+		self.assertFalse(
+			mixed_tabs_error_found,
+			f"Should not report mixed indentation for tabs-only script. Got: {errors}"
+		)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,9 @@
 Unit tests for whitelist functionality.
 """
 
+import contextlib
+import io
+import itertools
 import unittest
 import tempfile
 from pathlib import Path
@@ -9,101 +12,105 @@ import sys
 import os
 
 # Add parent directory to path for imports
-current_dir = Path(__file__).parent
-tests_dir = current_dir.parent
-project_root = tests_dir.parent
-sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
 
 from ignition_lint.cli import load_whitelist, generate_whitelist, collect_files
 from argparse import Namespace
 
 
-class TestWhitelistLoading(unittest.TestCase):
-	"""Tests for load_whitelist() function."""
+def read_whitelist_entries(whitelist_file: Path) -> list[str]:
+	"""Read the path entries of a whitelist file, skipping comments and blank lines."""
+	entries = []
+	for line in whitelist_file.read_text().splitlines():
+		line = line.strip()
+		if line and not line.startswith('#'):
+			entries.append(line)
+	return entries
 
-	def setUp(self):
-		"""Set up temporary directory for test files."""
-		self.temp_dir = tempfile.mkdtemp()
-		self.temp_path = Path(self.temp_dir)
-
-	def tearDown(self):
-		"""Clean up temporary files."""
-		import shutil
-		shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-	def test_load_valid_whitelist(self):
-		"""Valid whitelist loads correctly."""
-		whitelist_file = self.temp_path / "test_whitelist.txt"
-		whitelist_file.write_text(
-			"views/legacy/Dashboard/view.json\n"
-			"views/deprecated/OldWidget/view.json\n"
-		)
 
-		whitelist = load_whitelist(str(whitelist_file))
+def whitelist_entry_names(whitelist_file: Path) -> set[str]:
+	"""Get the file names of a whitelist file's path entries."""
+	return {Path(entry).name for entry in read_whitelist_entries(whitelist_file)}
 
-		self.assertEqual(len(whitelist), 2)
-		# Check that paths are converted to absolute
-		for path in whitelist:
-			self.assertIsInstance(path, Path)
-			self.assertTrue(path.is_absolute())
 
-	def test_whitelist_file_not_found(self):
-		"""Non-existent whitelist returns empty set."""
-		whitelist = load_whitelist("nonexistent_file.txt")
-		self.assertEqual(whitelist, set())
+def create_class_temp_dir(test_class) -> Path:
+	"""Create a temporary directory that is removed once every test in the class has run."""
+	# Outlives this function; the registered class cleanup removes it
+	temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+	test_class.addClassCleanup(temp_dir.cleanup)
+	return Path(temp_dir.name)
 
-	def test_comments_ignored(self):
-		"""Lines starting with # are ignored."""
-		whitelist_file = self.temp_path / "test_whitelist.txt"
-		whitelist_file.write_text(
-			"# This is a comment\n"
-			"views/legacy/Dashboard/view.json\n"
-			"# Another comment\n"
-			"views/deprecated/OldWidget/view.json\n"
-		)
 
-		whitelist = load_whitelist(str(whitelist_file))
-		self.assertEqual(len(whitelist), 2)
-
-	def test_blank_lines_ignored(self):
-		"""Empty lines are ignored."""
-		whitelist_file = self.temp_path / "test_whitelist.txt"
-		whitelist_file.write_text(
-			"views/legacy/Dashboard/view.json\n"
-			"\n"
-			"  \n"
-			"views/deprecated/OldWidget/view.json\n"
-			"\n"
-		)
+class CountingWhitelist(frozenset):
+	"""Whitelist that counts membership checks and fails if iterated, so lookups can be asserted exactly."""
 
-		whitelist = load_whitelist(str(whitelist_file))
-		self.assertEqual(len(whitelist), 2)
+	def __init__(self, *_entries):
+		# frozenset.__new__ already consumed the entries
+		super().__init__()
+		self.contains_calls = 0
 
-	def test_whitespace_trimmed(self):
-		"""Leading/trailing whitespace is trimmed."""
-		whitelist_file = self.temp_path / "test_whitelist.txt"
-		whitelist_file.write_text(
-			"  views/legacy/Dashboard/view.json  \n"
-			"\tviews/deprecated/OldWidget/view.json\t\n"
-		)
+	def __contains__(self, item):
+		self.contains_calls += 1
+		return super().__contains__(item)
+
+	def __iter__(self):
+		raise AssertionError("collect_files() should only check whitelist membership, not iterate it")
 
-		whitelist = load_whitelist(str(whitelist_file))
-		self.assertEqual(len(whitelist), 2)
 
-	def test_paths_normalized_to_absolute(self):
-		"""Relative paths converted to absolute."""
-		whitelist_file = self.temp_path / "test_whitelist.txt"
-		whitelist_file.write_text("views/legacy/Dashboard/view.json\n")
+# (name, whitelist file content, expected entry count) rows for TestWhitelistLoading
+WHITELIST_LOADING_CASES = (
+	("valid", "views/legacy/Dashboard/view.json\nviews/deprecated/OldWidget/view.json\n", 2),
+	(
+		"comments",
+		"# This is a comment\nviews/legacy/Dashboard/view.json\n"
+		"# Another comment\nviews/deprecated/OldWidget/view.json\n", 2
+	),
+	("blank_lines", "views/legacy/Dashboard/view.json\n\n  \nviews/deprecated/OldWidget/view.json\n\n", 2),
+	("whitespace", "  views/legacy/Dashboard/view.json  \n\tviews/deprecated/OldWidget/view.json\t\n", 2),
+	("relative_to_absolute", "views/legacy/Dashboard/view.json\n", 1),
+)
 
-		whitelist = load_whitelist(str(whitelist_file))
 
-		self.assertEqual(len(whitelist), 1)
-		path = list(whitelist)[0]
-		self.assertTrue(path.is_absolute())
+class TestWhitelistLoading(unittest.TestCase):
+	"""Tests for load_whitelist() function."""
+	class_temp_path: Path
+	temp_path: Path  # Per-test subdirectory of class_temp_path, created in setUp
+
+	@classmethod
+	def setUpClass(cls):
+		"""Set up one temporary directory for the class."""
+		cls.class_temp_path = create_class_temp_dir(cls)
+
+	def setUp(self):
+		"""Give each test its own subdirectory for whitelist files."""
+		self.temp_path = self.class_temp_path / self._testMethodName
+		self.temp_path.mkdir()
+
+	def test_load_whitelist_table(self):
+		"""Whitelist files parse to the expected absolute paths."""
+		for name, content, expected_len in WHITELIST_LOADING_CASES:
+			with self.subTest(name=name):
+				whitelist_file = self.temp_path / f"{name}_whitelist.txt"
+				whitelist_file.write_text(content)
+
+				whitelist = load_whitelist(str(whitelist_file))
+
+				self.assertEqual(len(whitelist), expected_len)
+				# Check that paths are converted to absolute
+				for path in whitelist:
+					self.assertIsInstance(path, Path)
+					self.assertTrue(path.is_absolute())
+
+	def test_whitelist_file_not_found(self):
+		"""Non-existent whitelist returns empty set."""
+		whitelist = load_whitelist("nonexistent_file.txt")
+		self.assertEqual(whitelist, set())
 
 	def test_io_error_returns_empty_set(self):
 		"""IO errors print warning and return empty set."""
-		# Use a directory path instead of file (will cause permission/IO error)
+		# Use a directory path instead of a file: open() raises IsADirectoryError on POSIX and
+		# PermissionError on Windows, both OSErrors, so the error branch runs on every platform.
+		# A real failing open() rather than a patched one keeps the test on the path users hit.
 		whitelist = load_whitelist(str(self.temp_path))
 		self.assertEqual(whitelist, set())
 
@@ -111,33 +118,37 @@ class TestWhitelistLoading(unittest.TestCase):
 class TestFileFiltering(unittest.TestCase):
 	"""Tests for collect_files() with whitelist."""
 
-	def setUp(self):
-		"""Set up temporary directory and test files."""
-		self.temp_dir = tempfile.mkdtemp()
-		self.temp_path = Path(self.temp_dir)
+	@classmethod
+	def setUpClass(cls):
+		"""Set up the test view files once; the tests only read them."""
+		cls.temp_path = create_class_temp_dir(cls)
 
 		# Create test view files
-		self.view1 = self.temp_path / "view1" / "view.json"
-		self.view1.parent.mkdir(parents=True)
-		self.view1.write_text('{"test": "data"}')
+		cls.view1 = cls.temp_path / "view1" / "view.json"
+		cls.view1.parent.mkdir(parents=True)
+		cls.view1.write_bytes(b'{"test": "data"}')
 
-		self.view2 = self.temp_path / "view2" / "view.json"
-		self.view2.parent.mkdir(parents=True)
-		self.view2.write_text('{"test": "data"}')
+		cls.view2 = cls.temp_path / "view2" / "view.json"
+		cls.view2.parent.mkdir(parents=True)
+		cls.view2.write_bytes(b'{"test": "data"}')
 
-		self.view3 = self.temp_path / "view3" / "view.json"
-		self.view3.parent.mkdir(parents=True)
-		self.view3.write_text('{"test": "data"}')
+		cls.view3 = cls.temp_path / "view3" / "view.json"
+		cls.view3.parent.mkdir(parents=True)
+		cls.view3.write_bytes(b'{"test": "data"}')
 
-	def tearDown(self):
-		"""Clean up temporary files."""
-		import shutil
-		shutil.rmtree(self.temp_dir, ignore_errors=True)
+		# Resolved once; collect_files() compares these against resolved input paths
+		cls.view1_abs = cls.view1.resolve()
+		cls.view2_abs = cls.view2.resolve()
+		cls.view3_abs = cls.view3.resolve()
+
+		# Shared, immutable whitelists; collect_files() only checks membership
+		cls.whitelist_view1 = frozenset({cls.view1_abs})
+		cls.whitelist_view1_view2 = frozenset({cls.view1_abs, cls.view2_abs})
 
 	def test_whitelist_filters_precommit_files(self):
 		"""Whitelisted files excluded from pre-commit filenames."""
 		# Create whitelist with view1
-		whitelist = {self.view1.resolve()}
+		whitelist = self.whitelist_view1
 
 		# Create args with filenames (simulates pre-commit)
 		args = Namespace(
@@ -150,12 +161,12 @@ class TestFileFiltering(unittest.TestCase):
 
 		# Only view2 should be collected (view1 is whitelisted)
 		self.assertEqual(len(files), 1)
-		self.assertEqual(files[0].resolve(), self.view2.resolve())
+		self.assertEqual(files[0].resolve(), self.view2_abs)
 
 	def test_whitelist_filters_glob_files(self):
 		"""Whitelisted files excluded from glob patterns."""
 		# Create whitelist with view1 and view2
-		whitelist = {self.view1.resolve(), self.view2.resolve()}
+		whitelist = self.whitelist_view1_view2
 
 		# Create args with glob pattern
 		args = Namespace(
@@ -168,7 +179,7 @@ class TestFileFiltering(unittest.TestCase):
 
 		# Only view3 should be collected (view1 and view2 are whitelisted)
 		self.assertEqual(len(files), 1)
-		self.assertEqual(files[0].resolve(), self.view3.resolve())
+		self.assertEqual(files[0].resolve(), self.view3_abs)
 
 	def test_empty_whitelist_includes_all(self):
 		"""Empty whitelist processes all files."""
@@ -188,33 +199,30 @@ class TestFileFiltering(unittest.TestCase):
 	def test_path_matching_works_with_relative_input(self):
 		"""Relative input paths matched against absolute whitelist."""
 		# Create whitelist with absolute path
-		whitelist = {self.view1.resolve()}
+		whitelist = self.whitelist_view1
 
 		# Use relative path in args
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			args = Namespace(
-				filenames=["view1/view.json"],
-				files=None,
-				verbose=False
-			)
+		self.addCleanup(os.chdir, os.getcwd())
+		os.chdir(self.temp_path)
+		args = Namespace(
+			filenames=["view1/view.json"],
+			files=None,
+			verbose=False
+		)
 
-			files, _ = collect_files(args, whitelist)
+		files, _ = collect_files(args, whitelist)
 
-			# view1 should be filtered out
-			self.assertEqual(len(files), 0)
-		finally:
-			os.chdir(cwd)
+		# view1 should be filtered out
+		self.assertEqual(len(files), 0)
 
 	def test_path_matching_works_with_absolute_input(self):
 		"""Absolute input paths matched against absolute whitelist."""
 		# Create whitelist with absolute path
-		whitelist = {self.view1.resolve()}
+		whitelist = self.whitelist_view1
 
 		# Use absolute path in args
 		args = Namespace(
-			filenames=[str(self.view1.resolve())],
+			filenames=[str(self.view1_abs)],
 			files=None,
 			verbose=False
 		)
@@ -226,7 +234,7 @@ class TestFileFiltering(unittest.TestCase):
 
 	def test_verbose_reports_ignored_files(self):
 		"""Verbose mode reports whitelisted files."""
-		whitelist = {self.view1.resolve()}
+		whitelist = self.whitelist_view1
 
 		args = Namespace(
 			filenames=[str(self.view1), str(self.view2)],
@@ -234,203 +242,184 @@ class TestFileFiltering(unittest.TestCase):
 			verbose=True
 		)
 
-		# Capture output (don't test exact message, just ensure it runs)
-		files, _ = collect_files(args, whitelist)
+		# Capture output in memory (don't test exact message, just that the skip is reported)
+		output = io.StringIO()
+		with contextlib.redirect_stdout(output):
+			files, _ = collect_files(args, whitelist)
 
 		# Only view2 should be collected
 		self.assertEqual(len(files), 1)
+		self.assertIn(str(self.view1), output.getvalue())
+
+	def test_large_whitelist_lookup_scales(self):
+		"""A large whitelist is only probed once per candidate file, never scanned."""
+		# Keep these files out of the shared class directory that the glob test scans
+		temp_path = create_class_temp_dir(type(self))
+
+		# Real files to collect, every other one whitelisted
+		view_files = []
+		for i in range(20):
+			view_file = temp_path / f"view{i}" / "view.json"
+			view_file.parent.mkdir()
+			view_file.write_bytes(b'{}')
+			view_files.append(view_file)
+		whitelisted = view_files[::2]
+		# Pad with entries that don't need to exist on disk
+		padding = (temp_path / "padding" / f"view{i}" / "view.json" for i in range(10000))
+
+		cases = {
+			"filenames": Namespace(filenames=[str(path) for path in view_files], files=None, verbose=False),
+			"glob": Namespace(filenames=[], files=str(temp_path / "view*" / "view.json"), verbose=False),
+		}
+		for name, args in cases.items():
+			with self.subTest(name=name):
+				whitelist = CountingWhitelist(itertools.chain((path.resolve() for path in whitelisted), padding))
+
+				with contextlib.redirect_stdout(io.StringIO()):
+					files, ignored = collect_files(args, whitelist)
+
+				self.assertEqual(len(files), 10)
+				self.assertCountEqual(ignored, whitelisted)
+				# One hashed lookup per candidate; CountingWhitelist fails the test if anything iterates it
+				self.assertEqual(whitelist.contains_calls, len(view_files))
 
 
 class TestGenerateWhitelist(unittest.TestCase):
 	"""Tests for generate_whitelist() function."""
+	temp_path: Path
+	output_file: Path  # Per-test whitelist file, named in setUp
 
-	def setUp(self):
-		"""Set up temporary directory and test files."""
-		self.temp_dir = tempfile.mkdtemp()
-		self.temp_path = Path(self.temp_dir)
+	@classmethod
+	def setUpClass(cls):
+		"""Set up the test directory structure once; the tests only read the views."""
+		cls.temp_path = create_class_temp_dir(cls)
 
 		# Create test directory structure
-		(self.temp_path / "views" / "legacy").mkdir(parents=True)
-		(self.temp_path / "views" / "deprecated").mkdir(parents=True)
+		(cls.temp_path / "views" / "legacy").mkdir(parents=True)
+		(cls.temp_path / "views" / "deprecated").mkdir(parents=True)
 
 		# Create test view files
-		(self.temp_path / "views" / "legacy" / "view1.json").write_text('{}')
-		(self.temp_path / "views" / "legacy" / "view2.json").write_text('{}')
-		(self.temp_path / "views" / "deprecated" / "view3.json").write_text('{}')
+		(cls.temp_path / "views" / "legacy" / "view1.json").write_bytes(b'{}')
+		(cls.temp_path / "views" / "legacy" / "view2.json").write_bytes(b'{}')
+		(cls.temp_path / "views" / "deprecated" / "view3.json").write_bytes(b'{}')
 
-	def tearDown(self):
-		"""Clean up temporary files."""
-		import shutil
-		shutil.rmtree(self.temp_dir, ignore_errors=True)
+	def setUp(self):
+		"""Give each test its own whitelist file in the shared directory."""
+		self.output_file = self.temp_path / f"{self._testMethodName}_whitelist.txt"
 
 	def test_generate_from_single_pattern(self):
 		"""Single glob pattern generates correct whitelist."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			generate_whitelist(
-				patterns=["views/legacy/*.json"],
-				output_file=str(output_file),
-				append=False,
-				dry_run=False
-			)
-
-			# Check file was created
-			self.assertTrue(output_file.exists())
-
-			# Check content
-			content = output_file.read_text()
-			self.assertIn("view1.json", content)
-			self.assertIn("view2.json", content)
-			self.assertNotIn("view3.json", content)
-		finally:
-			os.chdir(cwd)
+		generate_whitelist(
+			patterns=["views/legacy/*.json"],
+			output_file=str(self.output_file),
+			append=False,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		# Check file was created
+		self.assertTrue(self.output_file.exists())
+
+		# Check content: exactly the legacy views, parsed once into entry file names
+		self.assertSetEqual(whitelist_entry_names(self.output_file), {"view1.json", "view2.json"})
 
 	def test_generate_from_multiple_patterns(self):
 		"""Multiple glob patterns combined in whitelist."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			generate_whitelist(
-				patterns=["views/legacy/*.json", "views/deprecated/*.json"],
-				output_file=str(output_file),
-				append=False,
-				dry_run=False
-			)
-
-			# Check file was created
-			self.assertTrue(output_file.exists())
-
-			# Check content
-			content = output_file.read_text()
-			self.assertIn("view1.json", content)
-			self.assertIn("view2.json", content)
-			self.assertIn("view3.json", content)
-		finally:
-			os.chdir(cwd)
+		generate_whitelist(
+			patterns=["views/legacy/*.json", "views/deprecated/*.json"],
+			output_file=str(self.output_file),
+			append=False,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		# Check file was created
+		self.assertTrue(self.output_file.exists())
+
+		# Check content: views matched by both patterns
+		self.assertSetEqual(whitelist_entry_names(self.output_file), {"view1.json", "view2.json", "view3.json"})
 
 	def test_append_mode_adds_to_existing(self):
 		"""Append mode adds to existing whitelist."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-
-			# Create initial whitelist
-			output_file.write_text("views/existing/file.json\n")
-
-			# Append to it
-			generate_whitelist(
-				patterns=["views/legacy/*.json"],
-				output_file=str(output_file),
-				append=True,
-				dry_run=False
-			)
-
-			# Check content includes both old and new
-			content = output_file.read_text()
-			self.assertIn("views/existing/file.json", content)
-			self.assertIn("view1.json", content)
-		finally:
-			os.chdir(cwd)
+		# Create initial whitelist
+		self.output_file.write_text("views/existing/file.json\n")
+
+		# Append to it
+		generate_whitelist(
+			patterns=["views/legacy/*.json"],
+			output_file=str(self.output_file),
+			append=True,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		# Check content includes both old and new
+		content = self.output_file.read_text()
+		self.assertIn("views/existing/file.json", content)
+		self.assertIn("view1.json", content)
 
 	def test_append_mode_deduplicates(self):
 		"""Append mode removes duplicate paths."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-
-			# Create initial whitelist with view1
-			output_file.write_text("views/legacy/view1.json\n")
-
-			# Append same pattern
-			generate_whitelist(
-				patterns=["views/legacy/*.json"],
-				output_file=str(output_file),
-				append=True,
-				dry_run=False
-			)
-
-			# Check that view1 only appears once
-			content = output_file.read_text()
-			count = content.count("views/legacy/view1.json")
-			self.assertEqual(count, 1)
-		finally:
-			os.chdir(cwd)
+		# Create initial whitelist with view1
+		self.output_file.write_text("views/legacy/view1.json\n")
+
+		# Append same pattern
+		generate_whitelist(
+			patterns=["views/legacy/*.json"],
+			output_file=str(self.output_file),
+			append=True,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		# Check that view1 only appears once as an entry (comments don't count)
+		entries = read_whitelist_entries(self.output_file)
+		self.assertEqual(entries.count("views/legacy/view1.json"), 1)
 
 	def test_dry_run_does_not_write_file(self):
 		"""Dry run prints paths but doesn't write file."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			generate_whitelist(
-				patterns=["views/legacy/*.json"],
-				output_file=str(output_file),
-				append=False,
-				dry_run=True
-			)
-
-			# File should not be created
-			self.assertFalse(output_file.exists())
-		finally:
-			os.chdir(cwd)
+		generate_whitelist(
+			patterns=["views/legacy/*.json"],
+			output_file=str(self.output_file),
+			append=False,
+			dry_run=True,
+			root_dir=str(self.temp_path)
+		)
+
+		# File should not be created
+		self.assertFalse(self.output_file.exists())
 
 	def test_paths_are_relative(self):
 		"""Generated paths are relative to repo root."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			generate_whitelist(
-				patterns=["views/legacy/*.json"],
-				output_file=str(output_file),
-				append=False,
-				dry_run=False
-			)
-
-			content = output_file.read_text()
-
-			# Paths should be relative (not absolute)
-			self.assertNotIn(str(self.temp_path), content)
-			self.assertIn("views/legacy/", content)
-		finally:
-			os.chdir(cwd)
+		generate_whitelist(
+			patterns=["views/legacy/*.json"],
+			output_file=str(self.output_file),
+			append=False,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		content = self.output_file.read_text()
+
+		# Paths should be relative (not absolute)
+		self.assertNotIn(str(self.temp_path), content)
+		self.assertIn("views/legacy/", content)
 
 	def test_paths_are_sorted(self):
 		"""Generated paths are sorted alphabetically."""
-		output_file = self.temp_path / "whitelist.txt"
-
-		cwd = os.getcwd()
-		try:
-			os.chdir(self.temp_path)
-			generate_whitelist(
-				patterns=["views/**/*.json"],
-				output_file=str(output_file),
-				append=False,
-				dry_run=False
-			)
-
-			# Read paths (skip comments and blank lines)
-			paths = []
-			for line in output_file.read_text().split('\n'):
-				line = line.strip()
-				if line and not line.startswith('#'):
-					paths.append(line)
-
-			# Check that paths are sorted
-			self.assertEqual(paths, sorted(paths))
-		finally:
-			os.chdir(cwd)
+		generate_whitelist(
+			patterns=["views/**/*.json"],
+			output_file=str(self.output_file),
+			append=False,
+			dry_run=False,
+			root_dir=str(self.temp_path)
+		)
+
+		# Read paths (skip comments and blank lines)
+		paths = read_whitelist_entries(self.output_file)
+
+		# Check that paths are sorted with one pass over adjacent pairs
+		self.assertTrue(all(a <= b for a, b in itertools.pairwise(paths)), paths)
 
 
 if __name__ == '__main__':